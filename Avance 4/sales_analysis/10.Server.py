@@ -0,0 +1,378 @@
+"""
+Servicio local de consultas de ventas.
+
+Mantiene la serie diaria en memoria y responde peticiones HTTP/JSON (por TCP o
+por socket Unix) sin volver a importar pandas ni releer el CSV en cada análisis.
+
+Endpoints:
+- GET  /health       Estado del servicio y versión de los datos
+- GET  /strategies   Estrategias disponibles
+- POST /analyze      {"strategy", "window_size", "fecha_inicio", "fecha_fin"}
+- POST /batch        {"jobs": [<mismos campos que /analyze>, ...]}
+
+Uso:
+    python 10.Server.py --data ../../data/sales_price.csv --port 8765
+    python 10.Server.py --data ../../data/sales_price.csv --unix /tmp/ventas.sock
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+import argparse
+import asyncio
+import importlib.util
+import json
+import multiprocessing
+import os
+import numpy as np
+import pandas as pd
+
+# Importar el módulo 3.Utils usando importlib
+_utils_path = os.path.join(os.path.dirname(__file__), '3.Utils.py')
+_spec1 = importlib.util.spec_from_file_location("utils_module", _utils_path)
+_utils_module = importlib.util.module_from_spec(_spec1)
+_spec1.loader.exec_module(_utils_module)
+
+load_and_prepare_data = _utils_module.load_and_prepare_data
+
+# Importar el módulo 4.Analyzer usando importlib
+_analyzer_path = os.path.join(os.path.dirname(__file__), '4.Analyzer.py')
+_spec2 = importlib.util.spec_from_file_location("analyzer_module", _analyzer_path)
+_analyzer_module = importlib.util.module_from_spec(_spec2)
+_spec2.loader.exec_module(_analyzer_module)
+
+SalesAnalyzer = _analyzer_module.SalesAnalyzer
+AnalysisStrategyFactory = _analyzer_module.AnalysisStrategyFactory
+
+# ============================================================================
+# TRABAJO EN LOS PROCESOS DEL POOL
+# ============================================================================
+
+# Con fork, los procesos del pool (que se crean con la primera petición o tras
+# una recarga) heredarían los sockets abiertos de los clientes y el cierre de la
+# conexión nunca llegaría al cliente; forkserver/spawn no heredan esos descriptores
+_MP_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+# Serie diaria de cada proceso del pool (se recibe una sola vez, al iniciar el proceso)
+_WORKER_DATA: Optional[pd.DataFrame] = None
+
+
+def _init_worker(fechas_ns: np.ndarray, ventas: np.ndarray) -> None:
+    global _WORKER_DATA
+    _WORKER_DATA = pd.DataFrame({
+        'Fecha': pd.to_datetime(fechas_ns),
+        'TotalVentas': ventas,
+    })
+
+
+def _build_series(source: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Construye la serie diaria desde el CSV (se ejecuta fuera del event loop)."""
+    data = load_and_prepare_data(source)
+    return data['Fecha'].to_numpy(dtype='datetime64[ns]').view(np.int64), data['TotalVentas'].to_numpy()
+
+
+def run_jobs(jobs: List[Dict[str, Any]], data: Optional[pd.DataFrame] = None) -> List[Dict[str, Any]]:
+    """
+    Ejecuta una lista de análisis sobre la serie diaria.
+
+    Args:
+        jobs: Lista de dicts con strategy, window_size y opcionalmente fecha_inicio/fecha_fin
+        data: Serie diaria; si es None se usa la del proceso del pool
+
+    Returns:
+        Lista de resultados (AnalysisResult.to_dict) o {'error': ...} por cada job
+    """
+    data = _WORKER_DATA if data is None else data
+    results = []
+    for job in jobs:
+        if not isinstance(job, dict):
+            results.append({'error': 'Cada job debe ser un objeto JSON'})
+            continue
+        try:
+            strategy = AnalysisStrategyFactory.create_strategy(str(job.get('strategy', 'rolling')))
+            result = SalesAnalyzer(strategy).analyze(data, int(job.get('window_size', 5)),
+                                                     job.get('fecha_inicio'), job.get('fecha_fin'))
+            results.append(result.to_dict())
+        except Exception as e:
+            # Un job inválido (p. ej. window_size=1e400 -> OverflowError) no debe
+            # descartar los resultados del resto del batch
+            results.append({'error': str(e) or type(e).__name__})
+    return results
+
+
+# ============================================================================
+# SERVICIO ASÍNCRONO
+# ============================================================================
+
+class SalesQueryService:
+    """
+    Servidor asyncio que mantiene la serie diaria "caliente" en memoria.
+
+    - La serie se construye una vez (o se lee de una caché .npz si está al día)
+    - Los análisis se envían a un ProcessPoolExecutor; cada proceso recibe la
+      serie una sola vez en su inicializador, no en cada petición
+    - Una tarea en segundo plano vigila la fecha de modificación del CSV y
+      recarga la serie (y el pool) cuando cambia
+    """
+
+    def __init__(self, source: str, workers: int = 2, poll_interval: float = 2.0,
+                 cache_path: Optional[str] = None):
+        """
+        Inicializa el servicio.
+
+        Args:
+            source: Ruta al CSV de ventas (sales_price.csv) o a un directorio de particiones
+            workers: Procesos del pool; con 0 los análisis se ejecutan en el event loop
+            poll_interval: Segundos entre revisiones del archivo fuente
+            cache_path: Ruta .npz para guardar la serie diaria entre reinicios
+        """
+        self.source = source
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.cache_path = cache_path
+
+        self._data: Optional[pd.DataFrame] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._mtime_ns: Optional[int] = None
+        self._version = 0
+        self._watcher: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    # ------------------------------------------------------------------------
+    # Datos y recarga
+    # ------------------------------------------------------------------------
+
+    async def load(self) -> None:
+        """Carga (o reconstruye) la serie diaria y reinicia el pool de procesos."""
+        mtime_ns = os.stat(self.source).st_mtime_ns
+        fechas_ns, ventas = self._read_cache(mtime_ns)
+
+        if fechas_ns is None:
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=1, mp_context=_MP_CONTEXT) as builder:
+                fechas_ns, ventas = await loop.run_in_executor(builder, _build_series, self.source)
+            self._write_cache(mtime_ns, fechas_ns, ventas)
+
+        old_pool = self._pool
+        self._data = pd.DataFrame({'Fecha': pd.to_datetime(fechas_ns), 'TotalVentas': ventas})
+        self._pool = (
+            ProcessPoolExecutor(max_workers=self.workers, mp_context=_MP_CONTEXT,
+                                initializer=_init_worker, initargs=(fechas_ns, ventas))
+            if self.workers > 0 else None
+        )
+        self._mtime_ns = mtime_ns
+        self._version += 1
+
+        # Las peticiones en curso terminan con el pool anterior
+        if old_pool is not None:
+            old_pool.shutdown(wait=False)
+
+        print(f"🔄 Serie cargada (versión {self._version}): {len(self._data)} días")
+
+    async def _watch_source(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                if os.stat(self.source).st_mtime_ns != self._mtime_ns:
+                    await self.load()
+            except Exception as e:
+                # Archivo a medio escribir, inválido o pool roto: se reintenta en la
+                # próxima revisión en lugar de detener la recarga para siempre
+                print(f"⚠️  No se pudo recargar {self.source}: {e!r}")
+
+    def _read_cache(self, mtime_ns: int):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return None, None
+        with np.load(self.cache_path) as cache:
+            if int(cache['source_mtime_ns']) != mtime_ns:
+                return None, None
+            return cache['fechas_ns'], cache['ventas']
+
+    def _write_cache(self, mtime_ns: int, fechas_ns: np.ndarray, ventas: np.ndarray) -> None:
+        if self.cache_path:
+            # Con un archivo abierto np.savez no agrega '.npz', así _read_cache encuentra la misma ruta
+            tmp_path = self.cache_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, source_mtime_ns=mtime_ns, fechas_ns=fechas_ns, ventas=ventas)
+            os.replace(tmp_path, self.cache_path)
+
+    # ------------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------------
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765,
+                    unix_path: Optional[str] = None) -> None:
+        """Carga los datos y empieza a escuchar por TCP o por socket Unix."""
+        await self.load()
+
+        if unix_path:
+            if os.path.exists(unix_path):
+                os.remove(unix_path)
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=unix_path)
+            print(f"🚀 Escuchando en unix:{unix_path}")
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host, port)
+            print(f"🚀 Escuchando en http://{host}:{port}")
+
+        self._watcher = asyncio.create_task(self._watch_source())
+
+    async def serve_forever(self) -> None:
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        """Detiene el servidor, la vigilancia del archivo y el pool."""
+        if self._watcher is not None:
+            self._watcher.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+
+    # ------------------------------------------------------------------------
+    # Peticiones
+    # ------------------------------------------------------------------------
+
+    async def dispatch(self, method: str, path: str, params: Dict[str, Any]) -> Tuple[int, Any]:
+        """
+        Resuelve una petición ya decodificada.
+
+        Returns:
+            Tupla (código HTTP, cuerpo JSON)
+        """
+        if path == '/health' and method == 'GET':
+            return 200, {
+                'status': 'ok',
+                'version': self._version,
+                'dias': len(self._data),
+                'fecha_inicio': self._data['Fecha'].iat[0].strftime('%Y-%m-%d'),
+                'fecha_fin': self._data['Fecha'].iat[-1].strftime('%Y-%m-%d'),
+            }
+
+        if path == '/strategies' and method == 'GET':
+            return 200, {
+                name: strategy.get_strategy_info()
+                for name, strategy in AnalysisStrategyFactory.get_all_strategies().items()
+            }
+
+        if path == '/analyze' and method in ('GET', 'POST'):
+            result = (await self._run([params]))[0]
+            return (400 if 'error' in result else 200), result
+
+        if path == '/batch' and method == 'POST':
+            jobs = params.get('jobs')
+            if not isinstance(jobs, list):
+                return 400, {'error': "Se esperaba una lista en 'jobs'"}
+            if not all(isinstance(job, dict) for job in jobs):
+                return 400, {'error': "Cada elemento de 'jobs' debe ser un objeto JSON"}
+            return 200, {'resultados': await self._run(jobs)}
+
+        return 404, {'error': f'Ruta no encontrada: {method} {path}'}
+
+    async def _run(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if self._pool is None:
+            return run_jobs(jobs, self._data)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, run_jobs, jobs)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                try:
+                    method, target, _ = request_line.decode('latin-1').split(' ', 2)
+                    headers = {}
+                    while True:
+                        line = await reader.readline()
+                        if line in (b'\r\n', b'\n', b''):
+                            break
+                        name, _, value = line.decode('latin-1').partition(':')
+                        headers[name.strip().lower()] = value.strip()
+
+                    body = b''
+                    if 'content-length' in headers:
+                        body = await reader.readexactly(int(headers['content-length']))
+                except ValueError:
+                    # Sin una petición bien formada no se puede seguir leyendo la conexión
+                    self._write_response(writer, 400, {'error': 'Petición HTTP mal formada'}, False)
+                    await writer.drain()
+                    break
+
+                url = urlsplit(target)
+                try:
+                    params = dict(parse_qsl(url.query))
+                    if body:
+                        params.update(json.loads(body))
+                    status, payload = await self.dispatch(method.upper(), url.path, params)
+                except (ValueError, TypeError) as e:
+                    status, payload = 400, {'error': str(e)}
+                except Exception as e:
+                    # Cualquier otro fallo se responde en lugar de cerrar el socket sin respuesta
+                    status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool) -> None:
+        reasons = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 500: 'Internal Server Error'}
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status} {reasons.get(status, 'OK')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+
+
+# ============================================================================
+# FUNCIÓN PRINCIPAL
+# ============================================================================
+
+async def _serve(args: argparse.Namespace) -> None:
+    service = SalesQueryService(args.data, workers=args.workers,
+                                poll_interval=args.poll_interval, cache_path=args.cache)
+    await service.start(args.host, args.port, args.unix)
+    try:
+        await service.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main():
+    """Inicia el servicio de consultas desde la línea de comandos."""
+    default_data = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'sales_price.csv')
+
+    parser = argparse.ArgumentParser(description='Servicio local de consultas de ventas')
+    parser.add_argument('--data', default=default_data, help='CSV de ventas (sales_price.csv) o directorio de particiones')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', default=None, help='Ruta de socket Unix (en lugar de TCP)')
+    parser.add_argument('--workers', type=int, default=min(4, os.cpu_count() or 1),
+                        help='Procesos del pool (0 = ejecutar en el event loop)')
+    parser.add_argument('--poll-interval', type=float, default=2.0)
+    parser.add_argument('--cache', default=None, help='Archivo .npz para cachear la serie diaria')
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        print("\n👋 Servicio detenido")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Prueba de carga para el servicio de consultas (10.Server.py).
+
+Abre N conexiones concurrentes (keep-alive) y envía una mezcla de peticiones
+/analyze, /batch y /strategies. Reporta latencia p50/p99 y peticiones por segundo.
+
+Uso:
+    python 11.LoadTest.py --port 8765 --concurrency 32 --requests 5000
+    python 11.LoadTest.py --unix /tmp/ventas.sock --duration 10
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import itertools
+import json
+import time
+
+# ============================================================================
+# CLIENTE HTTP MÍNIMO
+# ============================================================================
+
+class _Connection:
+    """Conexión HTTP/1.1 keep-alive sobre TCP o socket Unix."""
+
+    def __init__(self, host: str, port: int, unix_path: Optional[str]):
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def open(self) -> None:
+        if self.unix_path:
+            self._reader, self._writer = await asyncio.open_unix_connection(self.unix_path)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Tuple[int, Any]:
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self.host}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        )
+        self._writer.write(head.encode('latin-1') + body)
+        await self._writer.drain()
+
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise ConnectionError('El servidor cerró la conexión')
+        status = int(status_line.split()[1])
+
+        length = 0
+        while True:
+            line = await self._reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.strip().lower() == 'content-length':
+                length = int(value.strip())
+
+        data = await self._reader.readexactly(length)
+        return status, json.loads(data)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+
+
+# ============================================================================
+# PRUEBA DE CARGA
+# ============================================================================
+
+def default_mix() -> List[Tuple[str, str, Optional[Dict[str, Any]]]]:
+    """Mezcla de peticiones: análisis individuales, un batch de ventanas y el listado."""
+    requests = [
+        ('POST', '/analyze', {'strategy': strategy, 'window_size': window})
+        for strategy in ('rolling', 'cumulative', 'force_brute')
+        for window in (3, 5, 7, 14)
+    ]
+    requests.append(('POST', '/batch', {
+        'jobs': [{'strategy': 'rolling', 'window_size': window} for window in range(1, 31)]
+    }))
+    requests.append(('GET', '/strategies', None))
+    return requests
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """Percentil por rango más cercano sobre una lista ya ordenada."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(percent / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+async def run_load_test(host: str = '127.0.0.1', port: int = 8765, unix_path: Optional[str] = None,
+                        concurrency: int = 16, total_requests: Optional[int] = 2000,
+                        duration: Optional[float] = None) -> Dict[str, float]:
+    """
+    Ejecuta la prueba de carga.
+
+    Args:
+        host, port: Dirección TCP del servicio
+        unix_path: Socket Unix (tiene prioridad sobre host/port)
+        concurrency: Número de conexiones concurrentes
+        total_requests: Total de peticiones a enviar (si no se usa duration)
+        duration: Duración en segundos (tiene prioridad sobre total_requests)
+
+    Returns:
+        Dict con peticiones, errores, rps, p50_ms, p99_ms, promedio_ms y max_ms
+    """
+    mix = itertools.cycle(default_mix())
+    latencies: List[float] = []
+    errors = 0
+    sent = 0
+
+    start = time.perf_counter()
+    deadline = start + duration if duration else None
+
+    def next_request():
+        nonlocal sent
+        if deadline is not None:
+            if time.perf_counter() >= deadline:
+                return None
+        elif sent >= total_requests:
+            return None
+        sent += 1
+        return next(mix)
+
+    async def client() -> None:
+        nonlocal errors
+        conn = _Connection(host, port, unix_path)
+        await conn.open()
+        try:
+            while True:
+                request = next_request()
+                if request is None:
+                    break
+                method, path, payload = request
+                t0 = time.perf_counter()
+                try:
+                    status, _ = await conn.request(method, path, payload)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    errors += 1
+                    await conn.close()
+                    await conn.open()
+                    continue
+                latencies.append(time.perf_counter() - t0)
+                if status != 200:
+                    errors += 1
+        finally:
+            await conn.close()
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'peticiones': len(latencies),
+        'errores': errors,
+        'segundos': elapsed,
+        'rps': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'promedio_ms': (sum(latencies) / len(latencies) * 1000) if latencies else 0.0,
+        'max_ms': (latencies[-1] * 1000) if latencies else 0.0,
+    }
+
+
+def print_report(results: Dict[str, float], concurrency: int) -> None:
+    """Imprime el resumen de la prueba de carga."""
+    print("\n" + "=" * 80)
+    print(f"⏱️  PRUEBA DE CARGA - {concurrency} conexiones concurrentes")
+    print("=" * 80)
+    print(f"   Peticiones completadas: {results['peticiones']:,}")
+    print(f"   Errores: {results['errores']:,}")
+    print(f"   Duración: {results['segundos']:.2f} s")
+    print(f"   Throughput: {results['rps']:,.1f} req/s")
+    print(f"   Latencia p50: {results['p50_ms']:.3f} ms")
+    print(f"   Latencia p99: {results['p99_ms']:.3f} ms")
+    print(f"   Latencia promedio: {results['promedio_ms']:.3f} ms | máxima: {results['max_ms']:.3f} ms")
+    print("=" * 80)
+
+
+# ============================================================================
+# FUNCIÓN PRINCIPAL
+# ============================================================================
+
+def main():
+    """Ejecuta la prueba de carga desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description='Prueba de carga del servicio de consultas')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', default=None, help='Ruta de socket Unix')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--duration', type=float, default=None, help='Segundos (reemplaza --requests)')
+    args = parser.parse_args()
+
+    results = asyncio.run(run_load_test(args.host, args.port, args.unix, args.concurrency,
+                                        args.requests, args.duration))
+    print_report(results, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
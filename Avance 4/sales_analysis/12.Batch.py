@@ -0,0 +1,330 @@
+"""
+Ejecutor de lotes de análisis en paralelo.
+
+Lee una especificación de jobs (JSON o YAML), coloca la serie diaria una sola
+vez en memoria compartida y reparte los jobs en un pool de procesos. Los
+procesos leen la serie directamente de la memoria compartida, así que en cada
+job solo viajan los parámetros y el resultado.
+
+Especificación de ejemplo (JSON):
+    {
+        "data": "../../data/sales_price.csv",
+        "output": "resultados_lote.json",
+        "jobs": [
+            {"strategy": "rolling", "window_size": 5},
+            {"strategy": "cumulative", "window_size": 7, "fecha_inicio": "2018-02-01", "fecha_fin": "2018-03-31"}
+        ],
+        "grid": {
+            "strategies": ["rolling", "cumulative"],
+            "window_sizes": [3, 5, 7, 14],
+            "ranges": [[null, null], ["2018-01-01", "2018-02-28"]]
+        }
+    }
+
+Uso:
+    python 12.Batch.py jobs.json --workers 1,2,4
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence
+import argparse
+import importlib.util
+import itertools
+import json
+import os
+import time
+import numpy as np
+import pandas as pd
+
+# Importar el módulo 3.Utils usando importlib
+_utils_path = os.path.join(os.path.dirname(__file__), '3.Utils.py')
+_spec1 = importlib.util.spec_from_file_location("utils_module", _utils_path)
+_utils_module = importlib.util.module_from_spec(_spec1)
+_spec1.loader.exec_module(_utils_module)
+
+load_and_prepare_data = _utils_module.load_and_prepare_data
+
+# Importar el módulo 4.Analyzer usando importlib
+_analyzer_path = os.path.join(os.path.dirname(__file__), '4.Analyzer.py')
+_spec2 = importlib.util.spec_from_file_location("analyzer_module", _analyzer_path)
+_analyzer_module = importlib.util.module_from_spec(_spec2)
+_spec2.loader.exec_module(_analyzer_module)
+
+SalesAnalyzer = _analyzer_module.SalesAnalyzer
+AnalysisStrategyFactory = _analyzer_module.AnalysisStrategyFactory
+
+# ============================================================================
+# ESPECIFICACIÓN DE JOBS
+# ============================================================================
+
+def load_job_spec(filepath: str) -> Dict[str, Any]:
+    """
+    Carga la especificación de jobs desde JSON o YAML.
+
+    Args:
+        filepath: Ruta a un archivo .json, .yaml o .yml
+
+    Returns:
+        Dict con la especificación
+
+    Raises:
+        ImportError: Si el archivo es YAML y PyYAML no está instalado
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        if filepath.lower().endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("Para leer especificaciones YAML instala PyYAML: pip install pyyaml")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def expand_jobs(spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Lista final de jobs: los explícitos más el producto cartesiano de 'grid'.
+
+    Returns:
+        Lista de dicts con strategy, window_size, fecha_inicio y fecha_fin
+    """
+    jobs = [dict(job) for job in spec.get('jobs', [])]
+
+    grid = spec.get('grid')
+    if grid:
+        for strategy, window_size, (fecha_inicio, fecha_fin) in itertools.product(
+            grid.get('strategies', ['rolling']),
+            grid.get('window_sizes', [5]),
+            grid.get('ranges', [[None, None]])
+        ):
+            jobs.append({
+                'strategy': strategy,
+                'window_size': window_size,
+                'fecha_inicio': fecha_inicio,
+                'fecha_fin': fecha_fin,
+            })
+
+    for job_id, job in enumerate(jobs):
+        job['id'] = job_id
+    return jobs
+
+
+# ============================================================================
+# SERIE DIARIA EN MEMORIA COMPARTIDA
+# ============================================================================
+
+class SharedDailySeries:
+    """
+    Serie diaria (fechas en ns + ventas) guardada en un bloque de memoria compartida.
+
+    El bloque contiene dos arrays contiguos de 8 bytes por elemento:
+    [fechas int64 (n)] [ventas float64 (n)]
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """Crea el bloque compartido y copia la serie una única vez."""
+        n = len(data)
+        self.length = n
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, 16 * n))
+
+        fechas, ventas = self._views(self._shm, n)
+        fechas[:] = data['Fecha'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+        ventas[:] = data['TotalVentas'].to_numpy(dtype=np.float64)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @staticmethod
+    def _views(shm: shared_memory.SharedMemory, n: int):
+        fechas = np.ndarray((n,), dtype=np.int64, buffer=shm.buf, offset=0)
+        ventas = np.ndarray((n,), dtype=np.float64, buffer=shm.buf, offset=8 * n)
+        return fechas, ventas
+
+    @classmethod
+    def attach(cls, name: str, n: int):
+        """
+        Se conecta a un bloque existente desde otro proceso.
+
+        Returns:
+            Tupla (SharedMemory, DataFrame) con 'Fecha' y 'TotalVentas' sobre la memoria compartida
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        fechas, ventas = cls._views(shm, n)
+        data = pd.DataFrame({
+            'Fecha': fechas.view('datetime64[ns]'),
+            'TotalVentas': ventas,
+        }, copy=False)
+        return shm, data
+
+    def close(self) -> None:
+        """Libera el bloque compartido."""
+        self._shm.close()
+        self._shm.unlink()
+
+
+# ============================================================================
+# TRABAJO EN LOS PROCESOS DEL POOL
+# ============================================================================
+
+# Cada proceso guarda la referencia al bloque para que la memoria siga mapeada
+_WORKER_SHM: Optional[shared_memory.SharedMemory] = None
+_WORKER_DATA: Optional[pd.DataFrame] = None
+
+
+def _init_worker(shm_name: str, n: int) -> None:
+    global _WORKER_SHM, _WORKER_DATA
+    _WORKER_SHM, _WORKER_DATA = SharedDailySeries.attach(shm_name, n)
+
+
+def _run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    record = dict(job)
+    try:
+        strategy = AnalysisStrategyFactory.create_strategy(str(job.get('strategy', 'rolling')))
+        result = SalesAnalyzer(strategy).analyze(_WORKER_DATA, int(job.get('window_size', 5)),
+                                                 job.get('fecha_inicio'), job.get('fecha_fin'))
+        record['resultado'] = result.to_dict()
+    except Exception as e:
+        # Un job inválido (p. ej. window_size=1e400 -> OverflowError) no detiene el lote
+        record['error'] = str(e) or type(e).__name__
+    record['duracion_ms'] = (time.perf_counter() - start) * 1000
+    record['pid'] = os.getpid()
+    return record
+
+
+# ============================================================================
+# EJECUTOR DE LOTES
+# ============================================================================
+
+class BatchRunner:
+    """
+    Ejecuta listas de jobs (estrategia, window_size, rango de fechas) en paralelo.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Args:
+            data: Serie diaria preparada (ver load_and_prepare_data)
+        """
+        self.data = data
+
+    def run(self, jobs: List[Dict[str, Any]], workers: int) -> Dict[str, Any]:
+        """
+        Ejecuta todos los jobs con el número de procesos indicado.
+
+        Returns:
+            Dict con 'resultados' (uno por job, en orden) y métricas de rendimiento
+        """
+        series = SharedDailySeries(self.data)
+        try:
+            start = time.perf_counter()
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(series.name, series.length)) as pool:
+                chunksize = max(1, len(jobs) // (workers * 4))
+                results = list(pool.map(_run_job, jobs, chunksize=chunksize))
+            elapsed = time.perf_counter() - start
+        finally:
+            series.close()
+
+        durations = [r['duracion_ms'] for r in results]
+        return {
+            'resultados': results,
+            'rendimiento': {
+                'workers': workers,
+                'jobs': len(jobs),
+                'errores': sum('error' in r for r in results),
+                'segundos': elapsed,
+                'jobs_por_segundo': len(jobs) / elapsed if elapsed else 0.0,
+                'promedio_job_ms': float(np.mean(durations)) if durations else 0.0,
+                'max_job_ms': float(np.max(durations)) if durations else 0.0,
+            },
+        }
+
+    def scaling(self, jobs: List[Dict[str, Any]], worker_counts: Sequence[int]) -> List[Dict[str, Any]]:
+        """
+        Ejecuta el mismo lote con distintas cantidades de procesos.
+
+        Returns:
+            Lista de corridas (salida de run) en el orden de worker_counts
+        """
+        return [self.run(jobs, workers) for workers in worker_counts]
+
+    @staticmethod
+    def print_report(runs: List[Dict[str, Any]]) -> None:
+        """Imprime el throughput por número de procesos."""
+        print("\n" + "=" * 80)
+        print(f"⏱️  EJECUCIÓN DE LOTE - {runs[0]['rendimiento']['jobs']} jobs")
+        print("=" * 80)
+        print(f"\n{'Workers':<10} {'Total (s)':>10} {'Jobs/s':>12} {'Prom. job (ms)':>16} {'Máx. job (ms)':>15} {'Errores':>8}")
+        print("-" * 75)
+
+        for run in runs:
+            r = run['rendimiento']
+            print(f"{r['workers']:<10} {r['segundos']:>10.3f} {r['jobs_por_segundo']:>12.1f} "
+                  f"{r['promedio_job_ms']:>16.3f} {r['max_job_ms']:>15.3f} {r['errores']:>8}")
+
+        best = max(runs, key=lambda run: run['rendimiento']['jobs_por_segundo'])['rendimiento']
+        print(f"\n✅ Mejor throughput: {best['workers']} workers ({best['jobs_por_segundo']:.1f} jobs/s)")
+        print("=" * 80)
+
+
+def write_results(runs: List[Dict[str, Any]], output_path: str) -> None:
+    """
+    Guarda los resultados de la última corrida en un solo archivo (.json o .csv).
+
+    En JSON se incluyen además las métricas de cada número de workers. En CSV
+    los campos del resultado llevan el prefijo 'resultado_', para que el rango
+    encontrado no reemplace al rango pedido (fecha_inicio/fecha_fin del job).
+    """
+    last = runs[-1]
+    if output_path.lower().endswith('.csv'):
+        rows = []
+        for record in last['resultados']:
+            row = {k: v for k, v in record.items() if k != 'resultado'}
+            row.update({f"resultado_{k}": v for k, v in record.get('resultado', {}).items()})
+            rows.append(row)
+        pd.DataFrame(rows).to_csv(output_path, index=False)
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'resultados': last['resultados'],
+                'rendimiento': [run['rendimiento'] for run in runs],
+            }, f, ensure_ascii=False, indent=2)
+
+
+# ============================================================================
+# FUNCIÓN PRINCIPAL
+# ============================================================================
+
+def main():
+    """Ejecuta un lote de jobs desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description='Ejecutor de lotes de análisis en paralelo')
+    parser.add_argument('spec', help='Especificación de jobs (.json, .yaml o .yml)')
+    parser.add_argument('--workers', default=str(os.cpu_count() or 1),
+                        help='Lista de cantidades de procesos a comparar, p. ej. 1,2,4')
+    parser.add_argument('--data', default=None, help='CSV o directorio de particiones (reemplaza "data" de la especificación)')
+    parser.add_argument('--output', default=None, help='Archivo de salida (reemplaza "output")')
+    args = parser.parse_args()
+
+    spec = load_job_spec(args.spec)
+    spec_dir = os.path.dirname(os.path.abspath(args.spec))
+
+    data_path = args.data or os.path.join(spec_dir, spec['data'])
+    output_path = args.output or os.path.join(spec_dir, spec.get('output', 'resultados_lote.json'))
+    worker_counts = [int(w) for w in args.workers.split(',')]
+
+    jobs = expand_jobs(spec)
+    data = load_and_prepare_data(data_path)
+    print(f"📦 {len(jobs)} jobs sobre {len(data)} días")
+
+    runner = BatchRunner(data)
+    runs = runner.scaling(jobs, worker_counts)
+    runner.print_report(runs)
+
+    write_results(runs, output_path)
+    print(f"💾 Resultados guardados en {output_path}")
+
+
+if __name__ == "__main__":
+    main()
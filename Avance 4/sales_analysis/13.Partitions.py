@@ -0,0 +1,311 @@
+"""
+Dataset de ventas particionado por mes.
+
+Convierte sales_price.csv en un directorio con un archivo .npz comprimido por mes (un
+array por columna) y un manifiesto con el rango de fechas de cada partición.
+Al leer un rango de fechas solo se abren las particiones que lo cruzan, y de
+cada una solo las columnas pedidas.
+
+Estructura:
+    sales_price_parts/
+    ├── _manifest.json
+    ├── mes=2018-01.npz
+    ├── mes=2018-02.npz
+    └── ...
+
+Uso:
+    python 13.Partitions.py --data ../../data/sales_price.csv --output ../../data/sales_price_parts
+    python 13.Partitions.py --output ../../data/sales_price_parts --desde 2018-03-01 --hasta 2018-03-31
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+import argparse
+import importlib.util
+import json
+import os
+import time
+import numpy as np
+import pandas as pd
+
+MANIFEST_NAME = '_manifest.json'
+DATE_COLUMN = 'SalesDate'
+NULL_SUFFIX = '__nulo'
+
+# ============================================================================
+# DATASET PARTICIONADO
+# ============================================================================
+
+class PartitionedSalesDataset:
+    """
+    Lectura de un directorio de particiones mensuales creado con write().
+
+    Cada partición es un .npz comprimido y sin pickle: las fechas se guardan
+    como datetime64[ns], los enteros con el dtype más angosto que admite el
+    mes, los decimales como float64 y el texto como bytes UTF-8 de ancho fijo
+    junto con una máscara '<columna>__nulo' que marca los valores faltantes.
+    El manifiesto conserva el dtype original de cada columna para restaurarlo
+    al leer.
+    """
+
+    def __init__(self, path: str):
+        """
+        Abre el dataset leyendo únicamente su manifiesto.
+
+        Args:
+            path: Directorio con _manifest.json y las particiones
+
+        Raises:
+            FileNotFoundError: Si el directorio no contiene un manifiesto
+        """
+        self.path = path
+        manifest_path = os.path.join(path, MANIFEST_NAME)
+        if not os.path.exists(manifest_path):
+            raise FileNotFoundError(f"No se encontró {MANIFEST_NAME} en {path}")
+
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+
+    @property
+    def columns(self) -> List[str]:
+        return self.manifest['columnas']
+
+    @staticmethod
+    def is_dataset(path: str) -> bool:
+        """Indica si la ruta es un directorio de particiones."""
+        return os.path.isdir(path) and os.path.exists(os.path.join(path, MANIFEST_NAME))
+
+    @classmethod
+    def write(cls, csv_path: str, output_dir: str) -> 'PartitionedSalesDataset':
+        """
+        Convierte el CSV de ventas en particiones mensuales.
+
+        Las filas sin SalesDate no pertenecen a ningún mes y se descartan (el
+        análisis diario tampoco las usa). Las particiones que ya no existen en
+        el CSV se eliminan y el manifiesto se escribe al final, así un lector
+        nunca ve un manifiesto que apunte a archivos a medio escribir.
+
+        Args:
+            csv_path: Ruta a sales_price.csv
+            output_dir: Directorio destino (se crea si no existe)
+
+        Returns:
+            PartitionedSalesDataset sobre el directorio escrito
+        """
+        df = pd.read_csv(csv_path)
+        df[DATE_COLUMN] = pd.to_datetime(df[DATE_COLUMN])
+        df = df[df[DATE_COLUMN].notna()].sort_values(DATE_COLUMN, kind='stable')
+
+        os.makedirs(output_dir, exist_ok=True)
+        partitions = []
+        dtypes = {
+            column: 'datetime64[ns]' if column == DATE_COLUMN
+            else 'str' if df[column].to_numpy().dtype == object
+            else str(df[column].dtype)
+            for column in df.columns
+        }
+
+        for mes, part in df.groupby(df[DATE_COLUMN].dt.strftime('%Y-%m'), sort=True):
+            arrays = {}
+            for column in df.columns:
+                if column == DATE_COLUMN:
+                    arrays[column] = part[column].to_numpy(dtype='datetime64[ns]')
+                elif dtypes[column] == 'str':
+                    # Bytes UTF-8 (1 byte por carácter ASCII en lugar de 4 con '<U');
+                    # los faltantes se guardan vacíos y se marcan en la máscara
+                    nulls = part[column].isna().to_numpy()
+                    arrays[column] = np.char.encode(part[column].fillna('').to_numpy().astype(str), 'utf-8')
+                    arrays[column + NULL_SUFFIX] = nulls
+                else:
+                    arrays[column] = _narrow(part[column].to_numpy())
+
+            filename = f"mes={mes}.npz"
+            tmp_path = os.path.join(output_dir, filename + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(tmp_path, os.path.join(output_dir, filename))
+
+            partitions.append({
+                'mes': mes,
+                'archivo': filename,
+                'fecha_min': part[DATE_COLUMN].iloc[0].strftime('%Y-%m-%d'),
+                'fecha_max': part[DATE_COLUMN].iloc[-1].strftime('%Y-%m-%d'),
+                'filas': int(len(part)),
+            })
+
+        current = {p['archivo'] for p in partitions}
+        for name in os.listdir(output_dir):
+            if name.startswith('mes=') and name.endswith('.npz') and name not in current:
+                os.remove(os.path.join(output_dir, name))
+
+        manifest = {
+            'formato': 'npz',
+            'compresion': 'zlib',
+            'particion': 'mes',
+            'columnas': list(df.columns),
+            'tipos': dtypes,
+            'origen': os.path.basename(csv_path),
+            'particiones': partitions,
+        }
+        tmp_path = os.path.join(output_dir, MANIFEST_NAME + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, os.path.join(output_dir, MANIFEST_NAME))
+
+        return cls(output_dir)
+
+    def partitions(self, fecha_inicio: Optional[str] = None,
+                   fecha_fin: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Particiones cuyo rango de fechas cruza [fecha_inicio, fecha_fin].
+
+        Las fechas se comparan por día completo (fecha_fin es inclusiva).
+        """
+        inicio = None if fecha_inicio is None else pd.Timestamp(fecha_inicio).strftime('%Y-%m-%d')
+        fin = None if fecha_fin is None else pd.Timestamp(fecha_fin).strftime('%Y-%m-%d')
+
+        # Las fechas ISO se ordenan igual como texto que como fecha
+        return [
+            p for p in self.manifest['particiones']
+            if (inicio is None or p['fecha_max'] >= inicio) and (fin is None or p['fecha_min'] <= fin)
+        ]
+
+    def read(self, fecha_inicio: Optional[str] = None, fecha_fin: Optional[str] = None,
+             columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Lee las filas dentro del rango abriendo solo las particiones necesarias.
+
+        Args:
+            fecha_inicio: Primer día incluido (None = desde el inicio)
+            fecha_fin: Último día incluido (None = hasta el final)
+            columns: Columnas a leer (None = todas)
+
+        Returns:
+            DataFrame con las ventas del rango, ordenado por SalesDate
+        """
+        columns = list(self.columns if columns is None else columns)
+        selected = self.partitions(fecha_inicio, fecha_fin)
+
+        # SalesDate se lee siempre para poder recortar los meses de los extremos
+        read_columns = columns if DATE_COLUMN in columns else columns + [DATE_COLUMN]
+        chunks = {column: [] for column in read_columns}
+        null_chunks = {column: [] for column in read_columns if self._dtype(column) == 'str'}
+
+        for partition in selected:
+            with np.load(os.path.join(self.path, partition['archivo']), allow_pickle=False) as npz:
+                for column in read_columns:
+                    chunks[column].append(npz[column])
+                for column, parts in null_chunks.items():
+                    key = column + NULL_SUFFIX
+                    parts.append(npz[key] if key in npz.files else np.zeros(partition['filas'], dtype=bool))
+
+        if not selected:
+            return pd.DataFrame({column: [] for column in columns})
+
+        arrays = {column: np.concatenate(parts) for column, parts in chunks.items()}
+        nulls = {column: np.concatenate(parts) for column, parts in null_chunks.items()}
+
+        # Recortar a días completos dentro del rango (solo afecta a los meses de los extremos)
+        fechas = arrays[DATE_COLUMN]
+        inicio = 0 if fecha_inicio is None else np.searchsorted(
+            fechas, np.datetime64(pd.Timestamp(fecha_inicio).normalize()), 'left')
+        fin = len(fechas) if fecha_fin is None else np.searchsorted(
+            fechas, np.datetime64(pd.Timestamp(fecha_fin).normalize() + pd.Timedelta(days=1)), 'left')
+
+        return pd.DataFrame({
+            column: self._restore(column, arrays[column][inicio:fin],
+                                  nulls[column][inicio:fin] if column in nulls else None)
+            for column in columns
+        })
+
+    def _dtype(self, column: str) -> Optional[str]:
+        return self.manifest.get('tipos', {}).get(column)
+
+    def _restore(self, column: str, array: np.ndarray,
+                 nulls: Optional[np.ndarray] = None) -> np.ndarray:
+        # Devuelve la columna con el dtype que tenía en el CSV
+        dtype = self._dtype(column)
+        if dtype is None or array.dtype.kind not in 'iuS':
+            return array
+        if dtype == 'str':
+            text = np.char.decode(array, 'utf-8')
+            if nulls is None or not nulls.any():
+                return text
+            text = text.astype(object)
+            text[nulls] = np.nan
+            return text
+        return array.astype(dtype, copy=False)
+
+    def print_summary(self) -> None:
+        """Imprime las particiones del dataset."""
+        print("\n" + "=" * 80)
+        print(f"🗂️  DATASET PARTICIONADO - {self.path}")
+        print("=" * 80)
+        print(f"\n{'Mes':<10} {'Desde':<12} {'Hasta':<12} {'Filas':>12} {'Tamaño (MB)':>12}")
+        print("-" * 62)
+
+        for p in self.manifest['particiones']:
+            size = os.path.getsize(os.path.join(self.path, p['archivo'])) / 1024 / 1024
+            print(f"{p['mes']:<10} {p['fecha_min']:<12} {p['fecha_max']:<12} {p['filas']:>12,} {size:>12.2f}")
+        print("=" * 80)
+
+
+def _narrow(array: np.ndarray) -> np.ndarray:
+    """Convierte una columna entera al dtype más angosto que contiene sus valores."""
+    if array.dtype.kind not in 'iu' or len(array) == 0:
+        return array
+    low, high = array.min(), array.max()
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return array.astype(dtype)
+    return array
+
+
+# ============================================================================
+# FUNCIÓN PRINCIPAL
+# ============================================================================
+
+def main():
+    """Escribe el dataset particionado y compara la carga de un rango contra el CSV."""
+    default_csv = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'sales_price.csv')
+    parser = argparse.ArgumentParser(description='Dataset de ventas particionado por mes')
+    parser.add_argument('--data', default=default_csv, help='CSV de ventas (sales_price.csv)')
+    parser.add_argument('--output', required=True, help='Directorio de particiones')
+    parser.add_argument('--desde', default=None, help='Inicio del rango a comparar (YYYY-MM-DD)')
+    parser.add_argument('--hasta', default=None, help='Fin del rango a comparar (YYYY-MM-DD)')
+    args = parser.parse_args()
+
+    compare = args.desde is not None or args.hasta is not None
+
+    # Sin rango se (re)escriben las particiones; con rango se reutilizan si ya existen
+    if compare and PartitionedSalesDataset.is_dataset(args.output):
+        dataset = PartitionedSalesDataset(args.output)
+    else:
+        dataset = PartitionedSalesDataset.write(args.data, args.output)
+        print(f"💾 Particiones escritas en {args.output}")
+    dataset.print_summary()
+
+    if not compare:
+        return
+
+    # Importar el módulo 3.Utils usando importlib
+    _utils_path = os.path.join(os.path.dirname(__file__), '3.Utils.py')
+    _spec = importlib.util.spec_from_file_location("utils_module", _utils_path)
+    _utils_module = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_utils_module)
+
+    timings = {}
+    for label, source in (('CSV completo', args.data), ('Particiones', args.output)):
+        start = time.perf_counter()
+        data = _utils_module.load_and_prepare_data(source, args.desde, args.hasta)
+        timings[label] = (time.perf_counter() - start) * 1000, len(data)
+
+    selected = dataset.partitions(args.desde, args.hasta)
+    print(f"\n📅 Rango {args.desde or 'inicio'} → {args.hasta or 'fin'}: "
+          f"{len(selected)} de {len(dataset.manifest['particiones'])} particiones")
+    for label, (ms, dias) in timings.items():
+        print(f"   {label:<14} {ms:>10.1f} ms  ({dias} días)")
+
+
+if __name__ == "__main__":
+    main()
@@ -118,7 +118,7 @@ def demo_runtime_strategy_switching():
         print(f"   Descripción: {info['descripcion']}")
         
         results = analyzer.analyze(data, window_size=5)
-        print(f"   ✅ Resultado: ${results['total_ventas']:,.2f}")
+        print(f"   ✅ Resultado: ${results.total_ventas:,.2f}")
 
 
 def demo_benchmark():
@@ -166,5 +166,5 @@ def demo_interactive_selection():
         print(f"   Uso recomendado: {info['uso_recomendado']}")
         
         results = analyzer.analyze(data, window_size=5)
-        print(f"   Resultado: {results['fecha_inicio'].strftime('%Y-%m-%d')} a {results['fecha_fin'].strftime('%Y-%m-%d')}")
-        print(f"   Total: ${results['total_ventas']:,.2f}")
\ No newline at end of file
+        print(f"   Resultado: {results.fecha_inicio.strftime('%Y-%m-%d')} a {results.fecha_fin.strftime('%Y-%m-%d')}")
+        print(f"   Total: ${results.total_ventas:,.2f}")
\ No newline at end of file
@@ -1,21 +1,41 @@
+from typing import Optional
+import importlib.util
+import os
+import numpy as np
 import pandas as pd
 
+# Importar el módulo 13.Partitions usando importlib
+_partitions_path = os.path.join(os.path.dirname(__file__), '13.Partitions.py')
+_spec1 = importlib.util.spec_from_file_location("partitions_module", _partitions_path)
+_partitions_module = importlib.util.module_from_spec(_spec1)
+_spec1.loader.exec_module(_partitions_module)
+
+PartitionedSalesDataset = _partitions_module.PartitionedSalesDataset
+
 # ============================================================================
 # FUNCIONES AUXILIARES
 # ============================================================================
 
-def load_and_prepare_data(filepath: str) -> pd.DataFrame:
+def load_and_prepare_data(filepath: str, fecha_inicio: Optional[str] = None,
+                          fecha_fin: Optional[str] = None) -> pd.DataFrame:
     """
     Carga y prepara los datos de ventas para análisis.
     
     Args:
-        filepath: Ruta al archivo CSV con datos de ventas
+        filepath: Ruta al archivo CSV con datos de ventas o a un directorio
+                  de particiones mensuales (ver 13.Partitions.py)
+        fecha_inicio: Primer día a incluir (None = desde el inicio)
+        fecha_fin: Último día a incluir (None = hasta el final)
         
     Returns:
         DataFrame preparado con ventas agregadas por día
     """
-    # Cargar datos
-    df = pd.read_csv(filepath)
+    # Cargar datos: del dataset particionado solo se leen los meses del rango
+    if PartitionedSalesDataset.is_dataset(filepath):
+        df = PartitionedSalesDataset(filepath).read(
+            fecha_inicio, fecha_fin, columns=['SalesDate', 'TotalPriceCalculated'])
+    else:
+        df = pd.read_csv(filepath, usecols=['SalesDate', 'TotalPriceCalculated'])
     
     # Convertir a datetime
     df['SalesDate'] = pd.to_datetime(df['SalesDate'])
@@ -28,4 +48,29 @@ def load_and_prepare_data(filepath: str) -> pd.DataFrame:
     # Ordenar por fecha
     ventas_por_dia = ventas_por_dia.sort_values('Fecha').reset_index(drop=True)
     
-    return ventas_por_dia
\ No newline at end of file
+    # Recortar al rango pedido (el dataset particionado ya viene recortado)
+    return select_date_range(ventas_por_dia, fecha_inicio, fecha_fin).reset_index(drop=True)
+
+
+def select_date_range(data: pd.DataFrame, fecha_inicio: Optional[str] = None,
+                      fecha_fin: Optional[str] = None) -> pd.DataFrame:
+    """
+    Restringe la serie diaria a un rango de fechas (inclusive) sin copiar.
+    
+    Args:
+        data: DataFrame ordenado por 'Fecha'
+        fecha_inicio: Primera fecha incluida (None = desde el inicio)
+        fecha_fin: Última fecha incluida (None = hasta el final)
+        
+    Returns:
+        Vista por posición de las filas dentro del rango
+    """
+    if fecha_inicio is None and fecha_fin is None:
+        return data
+    
+    # Búsqueda binaria sobre las fechas ordenadas
+    fechas = data['Fecha'].to_numpy()
+    inicio = 0 if fecha_inicio is None else np.searchsorted(fechas, np.datetime64(pd.Timestamp(fecha_inicio)), 'left')
+    fin = len(fechas) if fecha_fin is None else np.searchsorted(fechas, np.datetime64(pd.Timestamp(fecha_fin)), 'right')
+    
+    return data.iloc[inicio:fin]
\ No newline at end of file
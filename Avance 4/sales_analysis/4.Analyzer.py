@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Optional
 import pandas as pd
 import timeit
 import statistics
@@ -13,6 +13,7 @@ _strategy_module = importlib.util.module_from_spec(_spec1)
 _spec1.loader.exec_module(_strategy_module)
 
 AnalysisStrategy = _strategy_module.AnalysisStrategy
+AnalysisResult = _strategy_module.AnalysisResult
 RollingWindowStrategy = _strategy_module.RollingWindowStrategy
 
 # Importar el módulo 5.Factory usando importlib
@@ -23,6 +24,14 @@ _spec2.loader.exec_module(_factory_module)
 
 AnalysisStrategyFactory = _factory_module.AnalysisStrategyFactory
 
+# Importar el módulo 3.Utils usando importlib
+_utils_path = os.path.join(os.path.dirname(__file__), '3.Utils.py')
+_spec3 = importlib.util.spec_from_file_location("utils_module", _utils_path)
+_utils_module = importlib.util.module_from_spec(_spec3)
+_spec3.loader.exec_module(_utils_module)
+
+select_date_range = _utils_module.select_date_range
+
 # ============================================================================
 # CONTEXT CLASS: Analizador de Ventas
 # ============================================================================
@@ -57,17 +66,24 @@ class SalesAnalyzer:
         """Retorna información sobre la estrategia actual."""
         return self._strategy.get_strategy_info()
     
-    def analyze(self, data: pd.DataFrame, window_size: int = 5) -> Dict[str, Any]:
+    def analyze(self, data: pd.DataFrame, window_size: int = 5,
+                fecha_inicio: Optional[str] = None, fecha_fin: Optional[str] = None) -> AnalysisResult:
         """
         Ejecuta el análisis usando la estrategia actual.
         
         Args:
             data: DataFrame con datos de ventas
             window_size: Tamaño de la ventana (días consecutivos)
+            fecha_inicio: Primer día a considerar (None = desde el inicio)
+            fecha_fin: Último día a considerar (None = hasta el final)
             
         Returns:
-            Dict con resultados del análisis
+            AnalysisResult con los resultados del análisis
         """
+        # Restringir al rango de fechas (vista sin copia, común a todas las estrategias)
+        if data is not None:
+            data = select_date_range(data, fecha_inicio, fecha_fin)
+        
         # Validar datos
         if data is None or len(data) == 0:
             raise ValueError("El DataFrame no puede estar vacío")
@@ -78,26 +94,27 @@ class SalesAnalyzer:
         # Ejecutar estrategia
         return self._strategy.find_best_period(data, window_size)
     
-    def print_results(self, results: Dict[str, Any]) -> None:
+    def print_results(self, results: AnalysisResult) -> None:
         """
         Imprime los resultados del análisis de forma formateada.
         
         Args:
-            results: Diccionario con resultados del análisis
+            results: Resultado devuelto por analyze()
         """
         print("\n" + "=" * 80)
-        print(f"🎯 RESULTADOS DEL ANÁLISIS - Estrategia: {results['estrategia']}")
+        print(f"🎯 RESULTADOS DEL ANÁLISIS - Estrategia: {results.estrategia}")
         print("=" * 80)
         
-        print(f"\n📅 Periodo encontrado: {results['dias']} días consecutivos")
-        print(f"   Fecha inicio: {results['fecha_inicio'].strftime('%Y-%m-%d')}")
-        print(f"   Fecha fin: {results['fecha_fin'].strftime('%Y-%m-%d')}")
-        print(f"   Total de ventas: ${results['total_ventas']:,.2f}")
+        print(f"\n📅 Periodo encontrado: {results.dias} días consecutivos")
+        print(f"   Fecha inicio: {results.fecha_inicio.strftime('%Y-%m-%d')}")
+        print(f"   Fecha fin: {results.fecha_fin.strftime('%Y-%m-%d')}")
+        print(f"   Total de ventas: ${results.total_ventas:,.2f}")
         
         print("\n📊 Desglose por día:")
         print("-" * 80)
-        for idx, row in results['periodo'].iterrows():
-            print(f"   {row['Fecha'].strftime('%Y-%m-%d')}: ${row['TotalVentas']:,.2f}")
+        periodo = results.periodo
+        for fecha, total in zip(periodo['Fecha'].dt.strftime('%Y-%m-%d'), periodo['TotalVentas'].to_numpy()):
+            print(f"   {fecha}: ${total:,.2f}")
         
         print("=" * 80)
     
@@ -1,8 +1,77 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any
 from collections import deque
+import numpy as np
 import pandas as pd
 
+# ============================================================================
+# RESULTADO DEL ANÁLISIS
+# ============================================================================
+
+class AnalysisResult:
+    """
+    Resultado compacto de una estrategia.
+    
+    Solo guarda las posiciones inicio/fin, las fechas, el total y el nombre de
+    la estrategia. El DataFrame 'periodo' no se construye hasta que alguien lo
+    pide, y entonces es una vista por posición sobre los datos originales.
+    """
+    
+    __slots__ = ('_data', 'indice_inicio', 'indice_fin', 'fecha_inicio',
+                 'fecha_fin', 'total_ventas', 'estrategia')
+    
+    def __init__(self, data: pd.DataFrame, indice_inicio: int, indice_fin: int,
+                 total_ventas: float, estrategia: str):
+        """
+        Inicializa el resultado.
+        
+        Args:
+            data: DataFrame analizado (no se copia)
+            indice_inicio: Posición del primer día del periodo
+            indice_fin: Posición del último día del periodo (inclusive)
+            total_ventas: Ventas totales del periodo
+            estrategia: Nombre de la estrategia que produjo el resultado
+        """
+        self._data = data
+        self.indice_inicio = indice_inicio
+        self.indice_fin = indice_fin
+        self.fecha_inicio = data['Fecha'].iat[indice_inicio]
+        self.fecha_fin = data['Fecha'].iat[indice_fin]
+        self.total_ventas = float(total_ventas)
+        self.estrategia = estrategia
+    
+    @property
+    def dias(self) -> int:
+        """Número de días consecutivos del periodo."""
+        return self.indice_fin - self.indice_inicio + 1
+    
+    @property
+    def periodo(self) -> pd.DataFrame:
+        """Filas del periodo encontrado (vista por posición, sin copiar)."""
+        return self._data.iloc[self.indice_inicio:self.indice_fin + 1]
+    
+    def __getitem__(self, key: str) -> Any:
+        # Compatibilidad con el contrato anterior basado en diccionarios
+        if key not in ('periodo', 'fecha_inicio', 'fecha_fin', 'total_ventas', 'estrategia', 'dias'):
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Retorna el resultado sin el periodo (útil para serializar)."""
+        return {
+            'estrategia': self.estrategia,
+            'fecha_inicio': self.fecha_inicio.strftime('%Y-%m-%d'),
+            'fecha_fin': self.fecha_fin.strftime('%Y-%m-%d'),
+            'total_ventas': self.total_ventas,
+            'dias': self.dias,
+        }
+    
+    def __repr__(self) -> str:
+        return (f"AnalysisResult(estrategia={self.estrategia!r}, "
+                f"fecha_inicio={self.fecha_inicio:%Y-%m-%d}, fecha_fin={self.fecha_fin:%Y-%m-%d}, "
+                f"total_ventas={self.total_ventas:,.2f})")
+
+
 # ============================================================================
 # STRATEGY PATTERN: Interfaz y Estrategias Concretas
 # ============================================================================
@@ -11,19 +80,22 @@ class AnalysisStrategy(ABC):
     """
     Interfaz abstracta que define el contrato para todas las estrategias
     de análisis de ventas.
+    
+    Las estrategias no copian ni modifican el DataFrame de entrada: trabajan
+    por posición sobre la columna 'TotalVentas'.
     """
     
     @abstractmethod
-    def find_best_period(self, data: pd.DataFrame, window_size: int) -> Dict[str, Any]:
+    def find_best_period(self, data: pd.DataFrame, window_size: int) -> AnalysisResult:
         """
         Encuentra el periodo de N días consecutivos con mayores ventas.
         
         Args:
             data: DataFrame con columnas 'Fecha' y 'TotalVentas'
             window_size: Tamaño de la ventana (número de días consecutivos)
-            
+        
         Returns:
-            Dict con información del mejor periodo encontrado
+            AnalysisResult con información del mejor periodo encontrado
         """
         pass
     
@@ -36,6 +108,17 @@ class AnalysisStrategy(ABC):
             Dict con nombre, descripción, complejidad y características
         """
         pass
+    
+    def _build_result(self, data: pd.DataFrame, indice_fin: int, window_size: int,
+                      total_ventas: float) -> AnalysisResult:
+        """Crea el resultado a partir de la posición del último día de la ventana."""
+        return AnalysisResult(
+            data,
+            indice_fin - window_size + 1,
+            indice_fin,
+            total_ventas,
+            self.get_strategy_info()['nombre']
+        )
 
 
 class RollingWindowStrategy(AnalysisStrategy):
@@ -49,31 +132,17 @@ class RollingWindowStrategy(AnalysisStrategy):
     - Recomendado para producción
     """
     
-    def find_best_period(self, data: pd.DataFrame, window_size: int) -> Dict[str, Any]:
-        # Crear copia para no modificar el original
-        df_copy = data.copy()
-        
-        # Calcular ventana deslizante
-        column_name = f'Ventas_{window_size}dias'
-        df_copy[column_name] = df_copy['TotalVentas'].rolling(
-            window=window_size, 
+    def find_best_period(self, data: pd.DataFrame, window_size: int) -> AnalysisResult:
+        # Calcular ventana deslizante sin agregar columnas al DataFrame
+        sumas = data['TotalVentas'].rolling(
+            window=window_size,
             min_periods=window_size
-        ).sum()
+        ).sum().to_numpy()
         
-        # Encontrar el índice con mayor volumen
-        max_idx = df_copy[column_name].idxmax()
+        # Encontrar la posición con mayor volumen
+        max_pos = int(np.nanargmax(sumas))
         
-        # Extraer el periodo
-        periodo = df_copy.loc[max_idx - window_size + 1:max_idx].copy()
-        
-        return {
-            'periodo': periodo[['Fecha', 'TotalVentas']],
-            'fecha_inicio': periodo.iloc[0]['Fecha'],
-            'fecha_fin': periodo.iloc[-1]['Fecha'],
-            'total_ventas': df_copy.loc[max_idx, column_name],
-            'estrategia': self.get_strategy_info()['nombre'],
-            'dias': window_size
-        }
+        return self._build_result(data, max_pos, window_size, sumas[max_pos])
     
     def get_strategy_info(self) -> Dict[str, str]:
         return {
@@ -96,39 +165,26 @@ class ForceBruteStrategy(AnalysisStrategy):
     - Recomendado para aprendizaje
     """
     
-    def find_best_period(self, data: pd.DataFrame, window_size: int) -> Dict[str, Any]:
+    def find_best_period(self, data: pd.DataFrame, window_size: int) -> AnalysisResult:
         # Usar deque para mantener ventana deslizante
         ventana_deque = deque(maxlen=window_size)
-        ventanas = []
+        mejor_suma = None
+        mejor_fin = None
         
-        # Iterar sobre todas las ventanas
-        for i, row in data.iterrows():
-            ventana_deque.append(row['TotalVentas'])
+        # Iterar sobre los valores (sin construir una Series por fila como iterrows)
+        for i, venta in enumerate(data['TotalVentas'].to_numpy()):
+            ventana_deque.append(venta)
             
             # Cuando la deque está llena, calcular suma
             if len(ventana_deque) == window_size:
                 suma_ventana = sum(ventana_deque)
                 
-                ventanas.append({
-                    'indice_inicio': i - window_size + 1,
-                    'indice_fin': i,
-                    'fecha_inicio': data.iloc[i - window_size + 1]['Fecha'],
-                    'fecha_fin': data.iloc[i]['Fecha'],
-                    'total_ventas': suma_ventana
-                })
-        
-        # Encontrar el periodo con mayor volumen
-        max_ventana = max(ventanas, key=lambda x: x['total_ventas'])
-        periodo = data.iloc[max_ventana['indice_inicio']:max_ventana['indice_fin']+1].copy()
+                # Quedarse con el primer periodo de mayor volumen
+                if mejor_suma is None or suma_ventana > mejor_suma:
+                    mejor_suma = suma_ventana
+                    mejor_fin = i
         
-        return {
-            'periodo': periodo[['Fecha', 'TotalVentas']],
-            'fecha_inicio': max_ventana['fecha_inicio'],
-            'fecha_fin': max_ventana['fecha_fin'],
-            'total_ventas': max_ventana['total_ventas'],
-            'estrategia': self.get_strategy_info()['nombre'],
-            'dias': window_size
-        }
+        return self._build_result(data, mejor_fin, window_size, mejor_suma)
     
     def get_strategy_info(self) -> Dict[str, str]:
         return {
@@ -151,39 +207,18 @@ class CumulativeSumsStrategy(AnalysisStrategy):
     - Recomendado para flexibilidad
     """
     
-    def find_best_period(self, data: pd.DataFrame, window_size: int) -> Dict[str, Any]:
-        # Crear copia
-        df_copy = data.copy()
-        
-        # Crear columna de sumas acumuladas
-        df_copy['suma_acumulada'] = df_copy['TotalVentas'].cumsum()
+    def find_best_period(self, data: pd.DataFrame, window_size: int) -> AnalysisResult:
+        # Sumas acumuladas sobre el array de ventas
+        suma_acumulada = np.cumsum(data['TotalVentas'].to_numpy())
         
-        # Calcular ventana usando diferencias de sumas acumuladas
-        ventanas_valores = []
-        for i in range(len(df_copy)):
-            if i >= window_size - 1:
-                suma_ventana = df_copy['suma_acumulada'].iloc[i] - \
-                              (df_copy['suma_acumulada'].iloc[i-window_size] if i >= window_size else 0)
-                ventanas_valores.append(suma_ventana)
-            else:
-                ventanas_valores.append(None)
-        
-        # Agregar columna
-        column_name = f'Ventas_{window_size}dias'
-        df_copy[column_name] = ventanas_valores
+        # Ventana = S[i] - S[i - window_size], con S[-1] = 0 para la primera ventana
+        ventanas = suma_acumulada[window_size - 1:].copy()
+        ventanas[1:] -= suma_acumulada[:-window_size]
         
         # Encontrar el periodo con mayor volumen
-        max_idx = df_copy[column_name].idxmax()
-        periodo = df_copy.loc[max_idx - window_size + 1:max_idx].copy()
+        max_pos = int(np.argmax(ventanas))
         
-        return {
-            'periodo': periodo[['Fecha', 'TotalVentas']],
-            'fecha_inicio': periodo.iloc[0]['Fecha'],
-            'fecha_fin': periodo.iloc[-1]['Fecha'],
-            'total_ventas': df_copy.loc[max_idx, column_name],
-            'estrategia': self.get_strategy_info()['nombre'],
-            'dias': window_size
-        }
+        return self._build_result(data, max_pos + window_size - 1, window_size, ventanas[max_pos])
     
     def get_strategy_info(self) -> Dict[str, str]:
         return {
@@ -210,24 +245,14 @@ class MaxSingleDayStrategy(AnalysisStrategy):
     - Útil para identificar días excepcionales
     """
     
-    def find_best_period(self, data: pd.DataFrame, window_size: int = 1) -> Dict[str, Any]:
+    def find_best_period(self, data: pd.DataFrame, window_size: int = 1) -> AnalysisResult:
         # Ignorar window_size, siempre busca 1 día
-        window_size = 1
-        
-        # Encontrar el índice del día con mayor venta
-        max_idx = data['TotalVentas'].idxmax()
+        ventas = data['TotalVentas'].to_numpy()
         
-        # Extraer ese día
-        periodo = data.loc[[max_idx]].copy()
+        # Encontrar la posición del día con mayor venta
+        max_pos = int(np.nanargmax(ventas))
         
-        return {
-            'periodo': periodo[['Fecha', 'TotalVentas']],
-            'fecha_inicio': periodo.iloc[0]['Fecha'],
-            'fecha_fin': periodo.iloc[0]['Fecha'],
-            'total_ventas': periodo.iloc[0]['TotalVentas'],
-            'estrategia': self.get_strategy_info()['nombre'],
-            'dias': 1
-        }
+        return self._build_result(data, max_pos, 1, ventas[max_pos])
     
     def get_strategy_info(self) -> Dict[str, str]:
         return {
@@ -236,4 +261,4 @@ class MaxSingleDayStrategy(AnalysisStrategy):
             'complejidad': 'O(n)',
             'ventajas': 'Simple y directo, identifica días excepcionales',
             'uso_recomendado': 'Análisis de picos de venta, eventos especiales'
-        }
\ No newline at end of file
+        }
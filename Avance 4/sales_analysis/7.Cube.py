@@ -0,0 +1,432 @@
+from typing import Dict, List, Optional, Sequence
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# CUBO DE AGREGADOS: Día × Categoría × Ciudad × Vendedor
+# ============================================================================
+
+class SalesCube:
+    """
+    Cubo precalculado de ventas diarias sobre las dimensiones
+    (día, CategoryID, CityID, SalesPersonID).
+
+    Cada dimensión se codifica con coordenadas enteras densas (0..k-1), de modo
+    que cualquier consulta del tipo "ventas por día y categoría" o "ventas por
+    día y ciudad" se resuelve con una reducción de arrays en lugar de volver a
+    unir y agregar los 6.7M de registros.
+
+    Formato en disco (directorio):
+    - cube.f8: valores float64 en orden C con forma (dias, categorias, ciudades, vendedores)
+    - cube.json: metadatos (fecha origen, forma y etiquetas de cada dimensión)
+
+    Como el día es el eje principal, agregar un día nuevo equivale a escribir
+    un bloque al final del archivo, y el cubo se abre con np.memmap sin cargarlo
+    completo en memoria.
+
+    Las ventas sin categoría, ciudad o vendedor conocidos se acumulan en la
+    etiqueta UNKNOWN (-1) de esa dimensión; solo se descartan las ventas sin fecha.
+    """
+
+    DIMENSIONS = ('dia', 'CategoryID', 'CityID', 'SalesPersonID')
+
+    # Coordenada para ventas cuyo producto, cliente o vendedor no existe en los
+    # catálogos: se conservan para que los totales coincidan con load_and_prepare_data
+    UNKNOWN = -1
+
+    _DATA_FILE = 'cube.f8'
+    _META_FILE = 'cube.json'
+
+    def __init__(self, values: np.ndarray, origin: pd.Timestamp,
+                 labels: Dict[str, np.ndarray], path: Optional[str] = None):
+        """
+        Inicializa el cubo a partir de un array ya construido.
+
+        Args:
+            values: Array 4D con forma (dias, categorias, ciudades, vendedores)
+            origin: Fecha correspondiente al índice 0 del eje día
+            labels: Etiquetas originales (IDs) de cada dimensión no temporal
+            path: Directorio donde está persistido el cubo (si aplica)
+        """
+        self._values = values
+        self._origin = pd.Timestamp(origin).normalize()
+        self._labels = {dim: np.asarray(labels[dim], dtype=np.int64) for dim in self.DIMENSIONS[1:]}
+        self._path = path
+
+    # ------------------------------------------------------------------------
+    # Construcción
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def prepare_facts(sales_filepath: str, products_filepath: str,
+                      customers_filepath: str) -> pd.DataFrame:
+        """
+        Carga las ventas y les agrega CategoryID (products) y CityID (customers).
+
+        Args:
+            sales_filepath: Ruta a sales_price.csv
+            products_filepath: Ruta a products.csv
+            customers_filepath: Ruta a customers.csv
+
+        Returns:
+            DataFrame con SalesDate, CategoryID, CityID, SalesPersonID y TotalPriceCalculated
+            (CategoryID/CityID quedan en NaN si el producto o cliente no existe; ver UNKNOWN)
+        """
+        sales = pd.read_csv(
+            sales_filepath,
+            usecols=['SalesDate', 'ProductID', 'CustomerID', 'SalesPersonID', 'TotalPriceCalculated']
+        )
+        products = pd.read_csv(products_filepath, usecols=['ProductID', 'CategoryID'])
+        customers = pd.read_csv(customers_filepath, usecols=['CustomerID', 'CityID'])
+
+        sales = sales.merge(products, on='ProductID', how='left')
+        sales = sales.merge(customers, on='CustomerID', how='left')
+
+        return sales[['SalesDate', 'CategoryID', 'CityID', 'SalesPersonID', 'TotalPriceCalculated']]
+
+    @classmethod
+    def from_facts(cls, facts: pd.DataFrame) -> 'SalesCube':
+        """
+        Construye el cubo en memoria a partir de los hechos de venta.
+
+        Args:
+            facts: DataFrame con SalesDate, CategoryID, CityID, SalesPersonID
+                   y TotalPriceCalculated (ver prepare_facts)
+
+        Returns:
+            Instancia de SalesCube
+        """
+        facts = cls._clean_facts(facts)
+        if len(facts) == 0:
+            raise ValueError("No hay ventas con fecha válida para construir el cubo")
+
+        days = facts['SalesDate'].dt.normalize()
+        origin = days.min()
+
+        labels = {
+            dim: np.unique(facts[dim].to_numpy(dtype=np.int64))
+            for dim in cls.DIMENSIONS[1:]
+        }
+        n_days = int((days.max() - origin).days) + 1
+        shape = (n_days,) + tuple(len(labels[dim]) for dim in cls.DIMENSIONS[1:])
+
+        values = np.zeros(shape, dtype=np.float64)
+        cube = cls(values, origin, labels)
+        cube._accumulate(values, facts, origin)
+        return cube
+
+    @classmethod
+    def build(cls, sales_filepath: str, products_filepath: str, customers_filepath: str,
+              output_dir: str) -> 'SalesCube':
+        """
+        Construye el cubo desde los CSV y lo persiste en output_dir.
+
+        Returns:
+            Cubo abierto en modo memoria mapeada desde output_dir
+        """
+        facts = cls.prepare_facts(sales_filepath, products_filepath, customers_filepath)
+        cls.from_facts(facts).save(output_dir)
+        return cls.load(output_dir)
+
+    # ------------------------------------------------------------------------
+    # Persistencia
+    # ------------------------------------------------------------------------
+
+    def save(self, output_dir: str) -> None:
+        """
+        Persiste el cubo (datos binarios + metadatos JSON) en output_dir.
+
+        Args:
+            output_dir: Directorio destino (se crea si no existe)
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        data_path = os.path.join(output_dir, self._DATA_FILE)
+
+        # Escribir a un archivo temporal y reemplazar, por si el destino es
+        # el mismo archivo que está mapeado en memoria
+        tmp_path = data_path + '.tmp'
+        np.ascontiguousarray(self._values, dtype=np.float64).tofile(tmp_path)
+        os.replace(tmp_path, data_path)
+
+        self._write_meta(output_dir, self._values.shape)
+        self._path = output_dir
+
+    @classmethod
+    def load(cls, input_dir: str, mode: str = 'r') -> 'SalesCube':
+        """
+        Abre un cubo persistido sin cargarlo en memoria (np.memmap).
+
+        Args:
+            input_dir: Directorio con cube.f8 y cube.json
+            mode: Modo de apertura de np.memmap ('r' lectura, 'r+' lectura/escritura)
+
+        Returns:
+            Instancia de SalesCube respaldada por el archivo
+        """
+        with open(os.path.join(input_dir, cls._META_FILE), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+
+        values = np.memmap(
+            os.path.join(input_dir, cls._DATA_FILE),
+            dtype=np.float64,
+            mode=mode,
+            shape=tuple(meta['shape'])
+        )
+        labels = {dim: np.array(meta['labels'][dim], dtype=np.int64) for dim in cls.DIMENSIONS[1:]}
+        return cls(values, pd.Timestamp(meta['origin']), labels, path=input_dir)
+
+    def _write_meta(self, output_dir: str, shape: Sequence[int]) -> None:
+        meta = {
+            'dimensions': list(self.DIMENSIONS),
+            'origin': self._origin.strftime('%Y-%m-%d'),
+            'shape': [int(s) for s in shape],
+            'labels': {dim: self._labels[dim].tolist() for dim in self.DIMENSIONS[1:]},
+        }
+        with open(os.path.join(output_dir, self._META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+    # ------------------------------------------------------------------------
+    # Actualización incremental
+    # ------------------------------------------------------------------------
+
+    def append_sales(self, facts: pd.DataFrame) -> None:
+        """
+        Incorpora nuevas ventas (por ejemplo, un día recién cerrado) al cubo.
+
+        Los días posteriores al último día del cubo se agregan escribiendo
+        bloques al final del archivo; los días ya existentes se actualizan en
+        su lugar. Solo si aparece una categoría, ciudad o vendedor nuevo se
+        reconstruye el archivo completo, porque cambia la forma de los ejes internos.
+
+        Args:
+            facts: DataFrame con las mismas columnas que from_facts
+        """
+        facts = self._clean_facts(facts)
+        if len(facts) == 0:
+            return
+
+        days = facts['SalesDate'].dt.normalize()
+        if days.min() < self._origin:
+            raise ValueError(
+                f"No se pueden agregar ventas anteriores al origen del cubo "
+                f"({self._origin.strftime('%Y-%m-%d')})"
+            )
+
+        new_labels = {
+            dim: np.setdiff1d(np.unique(facts[dim].to_numpy(dtype=np.int64)), self._labels[dim])
+            for dim in self.DIMENSIONS[1:]
+        }
+        n_days = max(self.n_days, int((days.max() - self._origin).days) + 1)
+
+        if any(len(labels) for labels in new_labels.values()):
+            self._rebuild_with_labels(new_labels, n_days, facts)
+        elif self._path is None:
+            self._grow_in_memory(n_days, facts)
+        else:
+            self._append_on_disk(n_days, facts)
+
+    def _grow_in_memory(self, n_days: int, facts: pd.DataFrame) -> None:
+        if n_days > self.n_days:
+            extra = np.zeros((n_days - self.n_days,) + self._values.shape[1:], dtype=np.float64)
+            self._values = np.concatenate([self._values, extra])
+        self._accumulate(self._values, facts, self._origin)
+
+    def _append_on_disk(self, n_days: int, facts: pd.DataFrame) -> None:
+        shape = (n_days,) + self._values.shape[1:]
+        data_path = os.path.join(self._path, self._DATA_FILE)
+
+        # Soltar el mapeo actual antes de extender el archivo
+        if isinstance(self._values, np.memmap):
+            self._values.flush()
+        self._values = None
+
+        if n_days > self._n_days_on_disk(data_path, shape[1:]):
+            with open(data_path, 'r+b') as f:
+                f.truncate(int(np.prod(shape)) * np.dtype(np.float64).itemsize)
+
+        values = np.memmap(data_path, dtype=np.float64, mode='r+', shape=shape)
+        self._accumulate(values, facts, self._origin)
+        values.flush()
+        self._write_meta(self._path, shape)
+
+        self._values = np.memmap(data_path, dtype=np.float64, mode='r', shape=shape)
+
+    def _rebuild_with_labels(self, new_labels: Dict[str, np.ndarray], n_days: int,
+                             facts: pd.DataFrame) -> None:
+        labels = {
+            dim: np.union1d(self._labels[dim], new_labels[dim])
+            for dim in self.DIMENSIONS[1:]
+        }
+        shape = (n_days,) + tuple(len(labels[dim]) for dim in self.DIMENSIONS[1:])
+        values = np.zeros(shape, dtype=np.float64)
+
+        # Reubicar los valores existentes en las nuevas coordenadas
+        positions = [np.arange(self.n_days)] + [
+            np.searchsorted(labels[dim], self._labels[dim]) for dim in self.DIMENSIONS[1:]
+        ]
+        values[np.ix_(*positions)] = self._values
+
+        self._labels = labels
+        self._values = values
+        self._accumulate(values, facts, self._origin)
+
+        if self._path is not None:
+            self.save(self._path)
+            self._values = self.load(self._path)._values
+
+    @staticmethod
+    def _n_days_on_disk(data_path: str, inner_shape: Sequence[int]) -> int:
+        """Número de bloques diarios completos presentes en el archivo de datos."""
+        slab = int(np.prod(inner_shape)) * np.dtype(np.float64).itemsize
+        return os.path.getsize(data_path) // slab
+
+    # ------------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------------
+
+    @property
+    def n_days(self) -> int:
+        """Número de días cubiertos por el cubo."""
+        return self._values.shape[0]
+
+    @property
+    def shape(self) -> tuple:
+        """Forma del cubo (dias, categorias, ciudades, vendedores)."""
+        return self._values.shape
+
+    @property
+    def dates(self) -> pd.DatetimeIndex:
+        """Fechas correspondientes a cada posición del eje día."""
+        return pd.date_range(self._origin, periods=self.n_days, freq='D')
+
+    def labels(self, dim: str) -> np.ndarray:
+        """Retorna los IDs originales de una dimensión, ordenados por coordenada."""
+        return self._labels[dim]
+
+    def rollup(self, dims: Sequence[str] = ('dia',), **filters) -> np.ndarray:
+        """
+        Agrega el cubo conservando solo las dimensiones indicadas.
+
+        Args:
+            dims: Dimensiones a conservar, en el orden de DIMENSIONS
+            **filters: Filtros por ID original, p. ej. CategoryID=3 o CityID=[1, 2]
+
+        Returns:
+            Array con una dimensión por cada elemento de dims
+
+        Example:
+            cube.rollup(('dia', 'CategoryID'))  # ventas por día y categoría
+        """
+        for dim in dims:
+            if dim not in self.DIMENSIONS:
+                raise ValueError(f"Dimensión '{dim}' no válida. Disponibles: {', '.join(self.DIMENSIONS)}")
+
+        values = self._values[self._selector(filters)]
+        drop_axes = tuple(axis for axis, dim in enumerate(self.DIMENSIONS) if dim not in dims)
+        return values.sum(axis=drop_axes)
+
+    def rollup_frame(self, dims: Sequence[str] = ('dia',), **filters) -> pd.DataFrame:
+        """
+        Igual que rollup, pero retorna un DataFrame largo con las etiquetas originales.
+
+        Returns:
+            DataFrame con una columna por dimensión (Fecha para el día) y TotalVentas
+        """
+        values = self.rollup(dims, **filters)
+        kept = [dim for dim in self.DIMENSIONS if dim in dims]
+
+        axes = []
+        for dim in kept:
+            if dim == 'dia':
+                axes.append(self.dates)
+            else:
+                labels = self._labels[dim]
+                if dim in filters:
+                    labels = labels[self._positions(dim, filters[dim])]
+                axes.append(labels)
+
+        index = pd.MultiIndex.from_product(axes, names=['Fecha' if d == 'dia' else d for d in kept])
+        return pd.DataFrame({'TotalVentas': values.ravel()}, index=index).reset_index()
+
+    def daily_series(self, **filters) -> pd.DataFrame:
+        """
+        Serie diaria con columnas 'Fecha' y 'TotalVentas', lista para las estrategias.
+
+        Se omiten los días sin ninguna venta en todo el cubo (igual que
+        load_and_prepare_data), pero se conservan los días en los que solo el
+        segmento filtrado no vendió, para no romper la consecutividad.
+
+        Args:
+            **filters: Filtros por ID original (CategoryID, CityID, SalesPersonID)
+
+        Returns:
+            DataFrame compatible con SalesAnalyzer.analyze
+        """
+        totals = self.rollup(('dia',), **filters)
+        active = self.rollup(('dia',)) != 0
+        return pd.DataFrame({
+            'Fecha': self.dates[active],
+            'TotalVentas': totals[active],
+        })
+
+    # ------------------------------------------------------------------------
+    # Auxiliares
+    # ------------------------------------------------------------------------
+
+    def _positions(self, dim: str, ids) -> np.ndarray:
+        ids = np.atleast_1d(np.asarray(ids, dtype=np.int64))
+        labels = self._labels[dim]
+        positions = np.searchsorted(labels, ids)
+        valid = positions < len(labels)
+        if not valid.all() or not np.array_equal(labels[positions], ids):
+            raise ValueError(f"{dim} no encontrado en el cubo: {ids.tolist()}")
+        return positions
+
+    def _selector(self, filters: Dict[str, object]) -> tuple:
+        selector: List[object] = [slice(None)] * len(self.DIMENSIONS)
+        for dim, ids in filters.items():
+            if dim not in self.DIMENSIONS[1:]:
+                raise ValueError(f"No se puede filtrar por '{dim}'")
+            selector[self.DIMENSIONS.index(dim)] = self._positions(dim, ids)
+
+        # Con más de un filtro de lista se necesita np.ix_ para seleccionar el producto cartesiano
+        if sum(not isinstance(s, slice) for s in selector) > 1:
+            selector = [np.arange(n) if isinstance(s, slice) else s
+                        for s, n in zip(selector, self._values.shape)]
+            return np.ix_(*selector)
+        return tuple(selector)
+
+    @classmethod
+    def _clean_facts(cls, facts: pd.DataFrame) -> pd.DataFrame:
+        facts = facts.dropna(subset=['SalesDate'])
+        dims = list(cls.DIMENSIONS[1:])
+        if facts[dims].isna().any().any():
+            facts = facts.assign(**{dim: facts[dim].fillna(cls.UNKNOWN) for dim in dims})
+        if not pd.api.types.is_datetime64_any_dtype(facts['SalesDate']):
+            facts = facts.assign(SalesDate=pd.to_datetime(facts['SalesDate']))
+        # Un NaN en los pesos de bincount contaminaría la celda; groupby().sum() lo trata como 0
+        if facts['TotalPriceCalculated'].isna().any():
+            facts = facts.assign(TotalPriceCalculated=facts['TotalPriceCalculated'].fillna(0.0))
+        return facts
+
+    def _accumulate(self, values: np.ndarray, facts: pd.DataFrame, origin: pd.Timestamp) -> None:
+        """Suma los hechos en values usando coordenadas densas y np.bincount."""
+        day = (facts['SalesDate'].dt.normalize() - origin).dt.days.to_numpy(dtype=np.int64)
+        first, last = int(day.min()), int(day.max())
+
+        # Solo se toca el bloque de días afectados (clave para la carga incremental)
+        block = values[first:last + 1]
+        coords = [day - first] + [
+            np.searchsorted(self._labels[dim], facts[dim].to_numpy(dtype=np.int64))
+            for dim in self.DIMENSIONS[1:]
+        ]
+
+        flat = np.ravel_multi_index(coords, block.shape)
+        totals = np.bincount(
+            flat,
+            weights=facts['TotalPriceCalculated'].to_numpy(dtype=np.float64),
+            minlength=block.size
+        )
+        block.reshape(-1)[:] += totals
@@ -0,0 +1,619 @@
+from typing import Dict, Optional
+import copy
+import os
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import timeit
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# CONSULTAS SQL DE REFERENCIA (Avance 1)
+# ============================================================================
+
+# Consulta 1.1: Los 5 productos más vendidos
+SQL_TOP_PRODUCTS = """
+SELECT s.ProductID, p.ProductName, SUM(s.Quantity) AS TotalQuantity
+FROM products AS p
+JOIN sales AS s
+ON p.ProductID = s.ProductID
+GROUP BY s.ProductID, p.ProductName
+ORDER BY TotalQuantity DESC
+LIMIT 5;
+"""
+
+# Consulta 1.2: Vendedor principal de cada producto top
+SQL_TOP_SELLER_PER_PRODUCT = """
+WITH TopProducts AS (
+    SELECT
+        p.ProductID,
+        p.ProductName,
+        SUM(s.Quantity) as TotalVendido
+    FROM products p
+    JOIN sales s ON p.ProductID = s.ProductID
+    GROUP BY p.ProductID, p.ProductName
+    ORDER BY TotalVendido DESC
+    LIMIT 5
+),
+TopSellersPerProduct AS (
+    SELECT
+        s.ProductID,
+        s.SalesPersonID,
+        e.FirstName || ' ' || e.LastName as Vendedor,
+        SUM(s.Quantity) as UnidadesVendidas,
+        ROW_NUMBER() OVER (PARTITION BY s.ProductID ORDER BY SUM(s.Quantity) DESC) as rn
+    FROM sales s
+    JOIN employees e ON s.SalesPersonID = e.EmployeeID
+    WHERE s.ProductID IN (SELECT ProductID FROM TopProducts)
+    GROUP BY s.ProductID, s.SalesPersonID, e.FirstName, e.LastName
+)
+SELECT
+    tp.ProductID,
+    tp.ProductName,
+    tp.TotalVendido,
+    tsv.Vendedor,
+    tsv.UnidadesVendidas
+FROM TopProducts tp
+JOIN TopSellersPerProduct tsv ON tp.ProductID = tsv.ProductID
+WHERE tsv.rn = 1
+ORDER BY tp.TotalVendido DESC;
+"""
+
+# Consulta 1.3 reescrita con CTEs (el original usa tablas temporales)
+SQL_SELLER_SHARE = """
+WITH TopProducts AS (
+    SELECT
+        p.ProductID,
+        p.ProductName,
+        SUM(s.Quantity) as TotalVendido
+    FROM products p
+    JOIN sales s ON p.ProductID = s.ProductID
+    GROUP BY p.ProductID, p.ProductName
+    ORDER BY TotalVendido DESC
+    LIMIT 5
+),
+VendedorRanking AS (
+    SELECT
+        s.ProductID,
+        tp.ProductName,
+        s.SalesPersonID,
+        e.FirstName || ' ' || e.LastName as Vendedor,
+        SUM(s.Quantity) as UnidadesVendidas,
+        tp.TotalVendido,
+        ROUND((SUM(s.Quantity) * 100.0 / tp.TotalVendido), 2) as PorcentajeVendido,
+        ROW_NUMBER() OVER (PARTITION BY s.ProductID ORDER BY SUM(s.Quantity) * 100.0 / tp.TotalVendido DESC) as Ranking
+    FROM sales s
+    JOIN employees e ON s.SalesPersonID = e.EmployeeID
+    JOIN TopProducts tp ON s.ProductID = tp.ProductID
+    GROUP BY s.ProductID, tp.ProductName, s.SalesPersonID, e.FirstName, e.LastName, tp.TotalVendido
+)
+SELECT
+    vr.ProductID,
+    vr.ProductName,
+    vr.TotalVendido,
+    vr.Vendedor,
+    vr.UnidadesVendidas,
+    vr.PorcentajeVendido,
+    CASE
+        WHEN vr.PorcentajeVendido > 10 THEN 'SÍ'
+        ELSE 'NO'
+    END as Supera10Porciento
+FROM VendedorRanking vr
+WHERE vr.Ranking = 1
+ORDER BY vr.TotalVendido DESC;
+"""
+
+# Consultas 4.1 y 4.2 reescritas con CTEs: top 10 y su ranking en la categoría
+SQL_CATEGORY_RANKING = """
+WITH Top10Productos AS (
+    SELECT
+        s.ProductID,
+        p.ProductName,
+        c.CategoryID,
+        c.CategoryName,
+        SUM(s.Quantity) as TotalVendido
+    FROM sales s
+    JOIN products p ON s.ProductID = p.ProductID
+    JOIN categories c ON p.CategoryID = c.CategoryID
+    GROUP BY s.ProductID, p.ProductName, c.CategoryID, c.CategoryName
+    ORDER BY TotalVendido DESC
+    LIMIT 10
+),
+ConRankingEnCategoria AS (
+    SELECT
+        s.ProductID,
+        RANK() OVER (PARTITION BY c.CategoryID ORDER BY SUM(s.Quantity) DESC) as RankingEnCategoria,
+        COUNT(*) OVER (PARTITION BY c.CategoryID) as TotalProductosEnCategoria
+    FROM sales s
+    JOIN products p ON s.ProductID = p.ProductID
+    JOIN categories c ON p.CategoryID = c.CategoryID
+    GROUP BY s.ProductID, c.CategoryID
+)
+SELECT
+    tp.ProductID,
+    tp.ProductName,
+    tp.CategoryID,
+    tp.CategoryName,
+    tp.TotalVendido,
+    crc.RankingEnCategoria,
+    crc.TotalProductosEnCategoria
+FROM Top10Productos tp
+JOIN ConRankingEnCategoria crc ON tp.ProductID = crc.ProductID
+ORDER BY tp.TotalVendido DESC;
+"""
+
+# ============================================================================
+# MOTOR DE RANKING TOP-N VECTORIZADO
+# ============================================================================
+
+class TopNRankingEngine:
+    """
+    Responde las preguntas Top-N del Avance 1 a partir de arrays columnares.
+
+    En lugar de CTEs con ROW_NUMBER() y tablas temporales, se calcula una sola
+    matriz producto × vendedor con np.bincount sobre una clave compuesta
+    (producto * n_vendedores + vendedor). Todas las preguntas se derivan de esa
+    matriz con reducciones y ordenamientos parciales (np.argpartition).
+    """
+
+    def __init__(self, product_ids: np.ndarray, salesperson_ids: np.ndarray,
+                 quantities: np.ndarray, products: pd.DataFrame,
+                 employees: pd.DataFrame, categories: Optional[pd.DataFrame] = None):
+        """
+        Inicializa el motor con las columnas de ventas y los catálogos.
+
+        Args:
+            product_ids: Columna sales.ProductID
+            salesperson_ids: Columna sales.SalesPersonID
+            quantities: Columna sales.Quantity
+            products: Catálogo con ProductID, ProductName y CategoryID
+            employees: Catálogo con EmployeeID, FirstName y LastName
+            categories: Catálogo con CategoryID y CategoryName (opcional)
+        """
+        self._products = products.sort_values('ProductID').reset_index(drop=True)
+        self._employees = employees.sort_values('EmployeeID').reset_index(drop=True)
+        self._categories = categories
+
+        self._product_index = self._products['ProductID'].to_numpy(dtype=np.int64)
+        self._employee_index = self._employees['EmployeeID'].to_numpy(dtype=np.int64)
+
+        # Igual que los JOIN del SQL: los totales por producto solo exigen un producto
+        # existente (TopProducts no une employees); la matriz por vendedor exige ambos
+        product_codes, product_ok = self._encode(self._product_index, product_ids)
+        employee_codes, employee_ok = self._encode(self._employee_index, salesperson_ids)
+
+        self._product_codes = product_codes[product_ok]
+        self._employee_codes = employee_codes[product_ok]
+        self._employee_ok = employee_ok[product_ok]
+        self._quantities = np.asarray(quantities)[product_ok]
+
+        self._matrix = None
+        self._product_totals = None
+
+    # ------------------------------------------------------------------------
+    # Construcción
+    # ------------------------------------------------------------------------
+
+    @classmethod
+    def from_csv(cls, sales_filepath: str, products_filepath: str,
+                 employees_filepath: str, categories_filepath: Optional[str] = None) -> 'TopNRankingEngine':
+        """
+        Carga solo las columnas necesarias desde los CSV del proyecto.
+
+        Args:
+            sales_filepath: Ruta a sales.csv o sales_price.csv
+            products_filepath: Ruta a products.csv
+            employees_filepath: Ruta a employees.csv
+            categories_filepath: Ruta a categories.csv (opcional)
+        """
+        sales = pd.read_csv(
+            sales_filepath,
+            usecols=['ProductID', 'SalesPersonID', 'Quantity'],
+            dtype={'ProductID': np.int32, 'SalesPersonID': np.int32, 'Quantity': np.int32}
+        )
+        products = pd.read_csv(products_filepath, usecols=['ProductID', 'ProductName', 'CategoryID'])
+        employees = pd.read_csv(employees_filepath, usecols=['EmployeeID', 'FirstName', 'LastName'])
+        categories = pd.read_csv(categories_filepath) if categories_filepath else None
+
+        return cls(
+            sales['ProductID'].to_numpy(),
+            sales['SalesPersonID'].to_numpy(),
+            sales['Quantity'].to_numpy(),
+            products, employees, categories
+        )
+
+    @classmethod
+    def from_sqlite(cls, db_path: str) -> 'TopNRankingEngine':
+        """
+        Carga las columnas necesarias desde la base de datos SQLite del proyecto.
+
+        Args:
+            db_path: Ruta a proyecto_integrador.db
+        """
+        conn = sqlite3.connect(db_path)
+        try:
+            sales = pd.read_sql_query("SELECT ProductID, SalesPersonID, Quantity FROM sales", conn)
+            products = pd.read_sql_query("SELECT ProductID, ProductName, CategoryID FROM products", conn)
+            employees = pd.read_sql_query("SELECT EmployeeID, FirstName, LastName FROM employees", conn)
+            categories = pd.read_sql_query("SELECT CategoryID, CategoryName FROM categories", conn)
+        finally:
+            conn.close()
+
+        return cls(
+            sales['ProductID'].to_numpy(dtype=np.int64),
+            sales['SalesPersonID'].to_numpy(dtype=np.int64),
+            sales['Quantity'].to_numpy(dtype=np.int64),
+            products, employees, categories
+        )
+
+    # ------------------------------------------------------------------------
+    # Agregación
+    # ------------------------------------------------------------------------
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Matriz (productos × vendedores) de unidades vendidas, calculada una sola vez."""
+        if self._matrix is None:
+            n_products = len(self._product_index)
+            n_employees = len(self._employee_index)
+
+            ok = self._employee_ok
+            key = self._product_codes[ok] * n_employees + self._employee_codes[ok]
+            counts = np.bincount(key, weights=self._quantities[ok], minlength=n_products * n_employees)
+            self._matrix = np.rint(counts).astype(np.int64).reshape(n_products, n_employees)
+        return self._matrix
+
+    @property
+    def product_totals(self) -> np.ndarray:
+        """Unidades vendidas por producto (en el orden del catálogo), con cualquier vendedor."""
+        if self._product_totals is None:
+            counts = np.bincount(self._product_codes, weights=self._quantities,
+                                 minlength=len(self._product_index))
+            self._product_totals = np.rint(counts).astype(np.int64)
+        return self._product_totals
+
+    # ------------------------------------------------------------------------
+    # Preguntas del Avance 1
+    # ------------------------------------------------------------------------
+
+    def top_products(self, n: int = 5) -> pd.DataFrame:
+        """
+        Los N productos más vendidos (Consulta 1.1).
+
+        Returns:
+            DataFrame con ProductID, ProductName y TotalVendido
+        """
+        totals = self.product_totals
+        top = self._top_n(totals, n, candidates=np.flatnonzero(totals > 0))
+
+        return pd.DataFrame({
+            'ProductID': self._product_index[top],
+            'ProductName': self._products['ProductName'].to_numpy()[top],
+            'TotalVendido': totals[top],
+        })
+
+    def top_seller_per_product(self, n: int = 5) -> pd.DataFrame:
+        """
+        Vendedor con más unidades de cada uno de los N productos top (Consulta 1.2).
+
+        Returns:
+            DataFrame con ProductID, ProductName, TotalVendido, Vendedor y UnidadesVendidas
+        """
+        result = self.top_products(n)
+        rows = np.searchsorted(self._product_index, result['ProductID'].to_numpy())
+
+        best = self.matrix[rows].argmax(axis=1)
+        result['Vendedor'] = self._seller_names()[best]
+        result['UnidadesVendidas'] = self.matrix[rows, best]
+        return result
+
+    def seller_share(self, n: int = 5, threshold: float = 10.0) -> pd.DataFrame:
+        """
+        Participación del vendedor principal en cada producto top (Consulta 1.3).
+
+        Args:
+            n: Número de productos top
+            threshold: Umbral de participación en porcentaje
+
+        Returns:
+            DataFrame de top_seller_per_product con PorcentajeVendido y SuperaUmbral ('SÍ'/'NO')
+        """
+        result = self.top_seller_per_product(n)
+        result['PorcentajeVendido'] = np.round(
+            result['UnidadesVendidas'].to_numpy() * 100.0 / result['TotalVendido'].to_numpy(), 2
+        )
+        result['SuperaUmbral'] = np.where(result['PorcentajeVendido'] > threshold, 'SÍ', 'NO')
+        return result
+
+    def sellers_above_share(self, n: int = 5, threshold: float = 10.0) -> pd.DataFrame:
+        """
+        Todos los vendedores que superan el umbral de participación en algún producto top.
+
+        Returns:
+            DataFrame con ProductID, ProductName, Vendedor, UnidadesVendidas y PorcentajeVendido
+        """
+        top = self.top_products(n)
+        rows = np.searchsorted(self._product_index, top['ProductID'].to_numpy())
+
+        shares = self.matrix[rows] * 100.0 / top['TotalVendido'].to_numpy()[:, None]
+        product_pos, seller_pos = np.nonzero(shares > threshold)
+
+        result = pd.DataFrame({
+            'ProductID': top['ProductID'].to_numpy()[product_pos],
+            'ProductName': top['ProductName'].to_numpy()[product_pos],
+            'Vendedor': self._seller_names()[seller_pos],
+            'UnidadesVendidas': self.matrix[rows[product_pos], seller_pos],
+            'PorcentajeVendido': np.round(shares[product_pos, seller_pos], 2),
+        })
+        return result.sort_values(['ProductID', 'UnidadesVendidas'], ascending=[True, False],
+                                  ignore_index=True)
+
+    def category_ranking(self, n: int = 10) -> pd.DataFrame:
+        """
+        Los N productos top del catálogo y su posición en su categoría (Consultas 4.1 y 4.2).
+
+        Returns:
+            DataFrame con ProductID, ProductName, CategoryID, CategoryName, TotalVendido,
+            RankingEnCategoria y TotalProductosEnCategoria
+        """
+        totals = self.product_totals
+        sold = totals > 0
+        top = self._top_n(totals, n, candidates=np.flatnonzero(sold))
+
+        ranks, group_sizes = self._rank_within_categories(totals, sold)
+        category_ids = self._products['CategoryID'].to_numpy()
+
+        result = pd.DataFrame({
+            'ProductID': self._product_index[top],
+            'ProductName': self._products['ProductName'].to_numpy()[top],
+            'CategoryID': category_ids[top],
+            'CategoryName': self._category_names(category_ids[top]),
+            'TotalVendido': totals[top],
+            'RankingEnCategoria': ranks[top],
+            'TotalProductosEnCategoria': group_sizes[top],
+        })
+        return result
+
+    def top_products_per_category(self, k: int = 5) -> pd.DataFrame:
+        """
+        Los K productos más vendidos dentro de cada categoría.
+
+        Returns:
+            DataFrame con CategoryID, CategoryName, ProductID, ProductName,
+            TotalVendido y RankingEnCategoria
+        """
+        totals = self.product_totals
+        sold = totals > 0
+        ranks, _ = self._rank_within_categories(totals, sold)
+
+        selected = np.flatnonzero(sold & (ranks <= k))
+        category_ids = self._products['CategoryID'].to_numpy()
+        order = np.lexsort((-totals[selected], category_ids[selected]))
+        selected = selected[order]
+
+        return pd.DataFrame({
+            'CategoryID': category_ids[selected],
+            'CategoryName': self._category_names(category_ids[selected]),
+            'ProductID': self._product_index[selected],
+            'ProductName': self._products['ProductName'].to_numpy()[selected],
+            'TotalVendido': totals[selected],
+            'RankingEnCategoria': ranks[selected],
+        })
+
+    # ------------------------------------------------------------------------
+    # Verificación y benchmark contra SQLite
+    # ------------------------------------------------------------------------
+
+    def verify_against_sql(self, db_path: str) -> Dict[str, bool]:
+        """
+        Compara los resultados del motor con las consultas SQL del Avance 1.
+
+        Se comparan IDs de producto y totales; los nombres de vendedor solo se
+        comparan por unidades, porque ROW_NUMBER() desempata de forma arbitraria.
+
+        Args:
+            db_path: Ruta a la base de datos SQLite
+
+        Returns:
+            Dict con nombre de la consulta -> True si coincide
+        """
+        conn = sqlite3.connect(db_path)
+        try:
+            sql_top = pd.read_sql_query(SQL_TOP_PRODUCTS, conn)
+            sql_sellers = pd.read_sql_query(SQL_TOP_SELLER_PER_PRODUCT, conn)
+            sql_share = pd.read_sql_query(SQL_SELLER_SHARE, conn)
+            sql_category = pd.read_sql_query(SQL_CATEGORY_RANKING, conn)
+        finally:
+            conn.close()
+
+        top = self.top_products(5)
+        sellers = self.top_seller_per_product(5)
+        share = self.seller_share(5)
+        category = self.category_ranking(10)
+
+        checks = {
+            'top_products': self._same(sql_top, top, [('TotalQuantity', 'TotalVendido')]),
+            'top_seller_per_product': self._same(
+                sql_sellers, sellers, [('TotalVendido', 'TotalVendido'), ('UnidadesVendidas', 'UnidadesVendidas')]
+            ),
+            'seller_share': self._same(
+                sql_share, share, [('PorcentajeVendido', 'PorcentajeVendido')]
+            ) and list(sql_share['Supera10Porciento']) == list(share['SuperaUmbral']),
+            'category_ranking': self._same(
+                sql_category, category,
+                [('RankingEnCategoria', 'RankingEnCategoria'),
+                 ('TotalProductosEnCategoria', 'TotalProductosEnCategoria')]
+            ),
+        }
+
+        print("\n" + "=" * 80)
+        print("✅ VERIFICACIÓN CONTRA SQL (Avance 1)")
+        print("=" * 80)
+        for name, ok in checks.items():
+            print(f"   {name:<25} {'✅ coincide' if ok else '❌ difiere'}")
+
+        return checks
+
+    def benchmark_vs_sqlite(self, db_path: str, repetitions: int = 5,
+                            work_dir: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Compara el motor contra SQLite con y sin idx_sales_product_salesperson.
+
+        Se miden las consultas 1.2 (vendedor principal), 1.3 (participación) y
+        4.1/4.2 (ranking por categoría). Cada medición del motor parte de una
+        copia sin cachés, así que incluye toda la agregación con bincount y no
+        modifica el estado de esta instancia. El índice se crea y elimina sobre
+        una copia de la base de datos para no modificar el archivo original.
+
+        Args:
+            db_path: Ruta a la base de datos SQLite
+            repetitions: Repeticiones por medición
+            work_dir: Directorio para la copia temporal (por defecto, el temporal del sistema)
+
+        Returns:
+            Dict consulta -> {'motor', 'sqlite_sin_indice', 'sqlite_con_indice'} -> métricas en ms
+        """
+        print("\n" + "=" * 80)
+        print(f"⏱️  BENCHMARK TOP-N: Motor vectorizado vs SQLite - {repetitions} repeticiones")
+        print("=" * 80)
+
+        queries = {
+            'top_seller_per_product': (lambda engine: engine.top_seller_per_product(5),
+                                       SQL_TOP_SELLER_PER_PRODUCT),
+            'seller_share': (lambda engine: engine.seller_share(5), SQL_SELLER_SHARE),
+            'category_ranking': (lambda engine: engine.category_ranking(10), SQL_CATEGORY_RANKING),
+        }
+
+        tmp_dir = tempfile.mkdtemp(dir=work_dir)
+        db_copy = os.path.join(tmp_dir, os.path.basename(db_path))
+        shutil.copyfile(db_path, db_copy)
+
+        benchmark_results = {name: {} for name in queries}
+        conn = sqlite3.connect(db_copy)
+        try:
+            for name, (engine_query, _) in queries.items():
+                benchmark_results[name]['motor'] = self._timings(
+                    'Motor NumPy', lambda: engine_query(self._uncached_copy()), repetitions
+                )
+
+            conn.execute("DROP INDEX IF EXISTS idx_sales_product_salesperson")
+            for name, (_, sql) in queries.items():
+                benchmark_results[name]['sqlite_sin_indice'] = self._timings(
+                    'SQLite sin índice', lambda: conn.execute(sql).fetchall(), repetitions
+                )
+
+            conn.execute("CREATE INDEX idx_sales_product_salesperson ON sales(ProductID, SalesPersonID)")
+            conn.execute("ANALYZE")
+            for name, (_, sql) in queries.items():
+                benchmark_results[name]['sqlite_con_indice'] = self._timings(
+                    'SQLite con índice', lambda: conn.execute(sql).fetchall(), repetitions
+                )
+        finally:
+            conn.close()
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        for name, measurements in benchmark_results.items():
+            print(f"\n📋 {name}")
+            print(f"{'Medición':<20} {'Promedio (ms)':<15} {'Mínimo (ms)':<15} {'Máximo (ms)':<15}")
+            print("-" * 65)
+            for results in measurements.values():
+                print(f"{results['nombre']:<20} {results['promedio_ms']:>12.3f} {results['minimo_ms']:>12.3f} {results['maximo_ms']:>12.3f}")
+
+            motor = measurements['motor']['promedio_ms']
+            for key in ('sqlite_sin_indice', 'sqlite_con_indice'):
+                speedup = measurements[key]['promedio_ms'] / motor
+                print(f"🚀 Motor vs {measurements[key]['nombre']}: {speedup:.1f}x más rápido")
+        print("=" * 80)
+
+        return benchmark_results
+
+    # ------------------------------------------------------------------------
+    # Auxiliares
+    # ------------------------------------------------------------------------
+
+    def _uncached_copy(self) -> 'TopNRankingEngine':
+        """Copia superficial sin la matriz ni los totales calculados."""
+        engine = copy.copy(self)
+        engine._matrix = None
+        engine._product_totals = None
+        return engine
+
+    @staticmethod
+    def _encode(index: np.ndarray, values: np.ndarray):
+        """Convierte IDs originales en coordenadas densas; marca los IDs inexistentes."""
+        values = np.asarray(values, dtype=np.int64)
+        codes = np.searchsorted(index, values)
+        codes[codes == len(index)] = 0
+        return codes, index[codes] == values
+
+    @staticmethod
+    def _top_n(values: np.ndarray, n: int, candidates: np.ndarray) -> np.ndarray:
+        """Índices de los n mayores valores, ordenados de mayor a menor (ordenamiento parcial)."""
+        n = min(n, len(candidates))
+        if n == 0:
+            return candidates
+        part = candidates[np.argpartition(-values[candidates], n - 1)[:n]]
+        return part[np.argsort(-values[part], kind='stable')]
+
+    def _rank_within_categories(self, totals: np.ndarray, mask: np.ndarray):
+        """
+        Equivalente vectorizado de RANK() OVER (PARTITION BY CategoryID ORDER BY total DESC).
+
+        Returns:
+            Tupla (ranking, tamaño del grupo) alineada con el catálogo de productos
+        """
+        category_ids = self._products['CategoryID'].to_numpy()
+        items = np.flatnonzero(mask)
+        order = items[np.lexsort((-totals[items], category_ids[items]))]
+
+        cats = category_ids[order]
+        vals = totals[order]
+        positions = np.arange(len(order))
+
+        group_start = np.r_[True, cats[1:] != cats[:-1]]
+        start_pos = np.maximum.accumulate(np.where(group_start, positions, 0))
+
+        # Los empates comparten la posición del primer elemento del grupo de empate
+        run_start = group_start | np.r_[True, vals[1:] != vals[:-1]]
+        run_pos = np.maximum.accumulate(np.where(run_start, positions, 0))
+
+        group_ids = np.cumsum(group_start) - 1
+        sizes = np.bincount(group_ids)
+
+        ranks = np.zeros(len(totals), dtype=np.int64)
+        group_sizes = np.zeros(len(totals), dtype=np.int64)
+        ranks[order] = run_pos - start_pos + 1
+        group_sizes[order] = sizes[group_ids]
+        return ranks, group_sizes
+
+    def _seller_names(self) -> np.ndarray:
+        return (self._employees['FirstName'] + ' ' + self._employees['LastName']).to_numpy()
+
+    def _category_names(self, category_ids: np.ndarray) -> np.ndarray:
+        if self._categories is None:
+            return np.full(len(category_ids), None, dtype=object)
+        names = self._categories.set_index('CategoryID')['CategoryName']
+        return names.reindex(category_ids).to_numpy()
+
+    @staticmethod
+    def _same(sql_result: pd.DataFrame, result: pd.DataFrame, columns) -> bool:
+        if list(sql_result['ProductID']) != list(result['ProductID']):
+            return False
+        return all(
+            np.allclose(sql_result[sql_col].to_numpy(dtype=float), result[col].to_numpy(dtype=float))
+            for sql_col, col in columns
+        )
+
+    @staticmethod
+    def _timings(nombre: str, func, repetitions: int) -> Dict[str, float]:
+        func()  # Calentamiento (caché de páginas de SQLite)
+        times = timeit.repeat(func, number=1, repeat=repetitions)
+        return {
+            'nombre': nombre,
+            'promedio_ms': statistics.mean(times) * 1000,
+            'minimo_ms': min(times) * 1000,
+            'maximo_ms': max(times) * 1000,
+            'stdev_ms': (statistics.stdev(times) if len(times) > 1 else 0.0) * 1000,
+        }
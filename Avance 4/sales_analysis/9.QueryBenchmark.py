@@ -0,0 +1,594 @@
+from typing import Any, Dict, List, Optional, Sequence
+import argparse
+import os
+import re
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+
+# ============================================================================
+# CARGA DE CONSULTAS DESDE LOS SCRIPTS SQL
+# ============================================================================
+
+_SQL_SCRIPTS = (
+    os.path.join('Avance 1', 'codigo.sql'),
+    os.path.join('Avance 2', 'codigo.sql'),
+)
+
+_CLAUSE_PATTERN = re.compile(
+    r'\b(SELECT|FROM|JOIN|ON|WHERE|GROUP\s+BY|PARTITION\s+BY|ORDER\s+BY|HAVING|LIMIT)\b',
+    re.IGNORECASE
+)
+_TABLE_PATTERN = re.compile(
+    r'\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?',
+    re.IGNORECASE
+)
+_INDEX_PATTERN = re.compile(
+    r'CREATE\s+INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s+ON\s+(\w+)\s*\(([^)]*)\)',
+    re.IGNORECASE
+)
+_SETUP_PATTERN = re.compile(
+    r'^\s*CREATE\s+TEMP(?:ORARY)?\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s+AS\s+',
+    re.IGNORECASE
+)
+_SQL_KEYWORDS = {
+    'on', 'where', 'group', 'order', 'join', 'left', 'inner', 'cross', 'limit',
+    'select', 'having', 'as', 'union', 'partition'
+}
+
+
+def classify_statement(sql: str) -> str:
+    """
+    Clasifica una sentencia SQL según su efecto.
+
+    Returns:
+        'query' (SELECT/WITH), 'setup' (CREATE TEMP TABLE), 'index' (CREATE INDEX),
+        'cleanup' (DROP) u 'other' (DDL/DML que modifica la base de datos)
+    """
+    head = ' '.join(sql.split()[:3]).upper()
+    if head.startswith(('SELECT', 'WITH')):
+        return 'query'
+    if head.startswith(('CREATE TEMP TABLE', 'CREATE TEMPORARY TABLE')):
+        return 'setup'
+    if head.startswith(('CREATE INDEX', 'CREATE UNIQUE INDEX')):
+        return 'index'
+    if head.startswith('DROP'):
+        return 'cleanup'
+    return 'other'
+
+
+def load_sql_statements(filepath: str) -> List[Dict[str, str]]:
+    """
+    Divide un script SQL en sentencias, conservando el comentario descriptivo.
+
+    Se ignoran los comandos del shell de sqlite (.timer on) y los triggers se
+    mantienen completos gracias a sqlite3.complete_statement().
+
+    Args:
+        filepath: Ruta al archivo .sql
+
+    Returns:
+        Lista de dicts con 'sql', 'tipo', 'descripcion' y 'origen'
+    """
+    statements = []
+    buffer: List[str] = []
+    descripcion = ''
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            stripped = line.strip()
+
+            if not buffer:
+                if not stripped or stripped.startswith('.'):
+                    continue
+                if stripped.startswith('--'):
+                    comment = stripped.lstrip('-').strip()
+                    if comment.lower().startswith(('consulta', 'pregunta')):
+                        descripcion = comment
+                    continue
+
+            buffer.append(line)
+            sql = ''.join(buffer)
+            if sqlite3.complete_statement(sql):
+                sql = sql.strip()
+                statements.append({
+                    'sql': sql,
+                    'tipo': classify_statement(sql),
+                    'descripcion': descripcion,
+                    'origen': os.path.basename(os.path.dirname(filepath)) or filepath,
+                })
+                buffer = []
+
+    return statements
+
+
+def load_workload(project_root: str, scripts: Sequence[str] = _SQL_SCRIPTS) -> List[Dict[str, str]]:
+    """
+    Carga las sentencias de los scripts del Avance 1 y Avance 2.
+
+    Las consultas repetidas entre scripts se conservan una sola vez.
+
+    Args:
+        project_root: Directorio raíz del proyecto
+        scripts: Rutas relativas de los scripts SQL
+
+    Returns:
+        Lista de sentencias en el orden de los scripts
+    """
+    workload = []
+    seen = set()
+    for script in scripts:
+        for statement in load_sql_statements(os.path.join(project_root, script)):
+            key = ' '.join(statement['sql'].split()).lower()
+            if statement['tipo'] == 'query' and key in seen:
+                continue
+            seen.add(key)
+            workload.append(statement)
+    return workload
+
+
+# ============================================================================
+# DERIVACIÓN DE ÍNDICES CANDIDATOS
+# ============================================================================
+
+def derive_candidate_indexes(sql: str, schema: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+    """
+    Propone índices compuestos a partir de las columnas usadas en WHERE, GROUP BY y JOIN.
+
+    Por cada tabla se proponen dos candidatos:
+    - clave: columnas de WHERE, luego GROUP BY / PARTITION BY, luego JOIN
+    - cubriente: la clave más el resto de columnas de la tabla que usa la consulta,
+      para que SQLite pueda responder solo con el índice
+
+    Args:
+        sql: Consulta SQL
+        schema: Dict tabla -> columnas de las tablas reales de la base de datos
+
+    Returns:
+        Lista de dicts con 'tabla', 'columnas' y 'tipo' ('clave' o 'cubriente')
+    """
+    lower_schema = {table.lower(): table for table in schema}
+
+    aliases: Dict[str, str] = {}
+    tables_in_query = []
+    for table, alias in _TABLE_PATTERN.findall(sql):
+        real = lower_schema.get(table.lower())
+        if real is None:
+            continue  # CTE o tabla temporal
+        if real not in tables_in_query:
+            tables_in_query.append(real)
+        aliases[table.lower()] = real
+        if alias and alias.lower() not in _SQL_KEYWORDS:
+            aliases[alias.lower()] = real
+
+    clauses = [(m.start(), re.sub(r'\s+', ' ', m.group(1).upper())) for m in _CLAUSE_PATTERN.finditer(sql)]
+
+    def clause_at(position: int) -> str:
+        current = ''
+        for start, name in clauses:
+            if start > position:
+                break
+            current = name
+        return current
+
+    usage: Dict[str, Dict[str, List[str]]] = {
+        table: {'where': [], 'group': [], 'join': [], 'other': []} for table in tables_in_query
+    }
+
+    def register(table: str, column: str, position: int) -> None:
+        clause = clause_at(position)
+        bucket = {
+            'WHERE': 'where', 'HAVING': 'where',
+            'GROUP BY': 'group', 'PARTITION BY': 'group',
+            'ON': 'join',
+        }.get(clause, 'other')
+        if column not in usage[table][bucket]:
+            usage[table][bucket].append(column)
+
+    # Columnas calificadas (alias.columna)
+    for match in re.finditer(r'\b(\w+)\.(\w+)\b', sql):
+        table = aliases.get(match.group(1).lower())
+        if table is None:
+            continue
+        column = _match_column(schema[table], match.group(2))
+        if column:
+            register(table, column, match.start())
+
+    # Columnas sin calificar: solo si pertenecen a una única tabla de la consulta
+    for match in re.finditer(r'(?<![.\w])(\w+)(?![.\w])', sql):
+        owners = [t for t in tables_in_query if _match_column(schema[t], match.group(1))]
+        if len(owners) == 1:
+            register(owners[0], _match_column(schema[owners[0]], match.group(1)), match.start())
+
+    candidates = []
+    for table in tables_in_query:
+        cols = usage[table]
+        key = _dedupe(cols['where'] + cols['group'] + cols['join'])
+        if not key:
+            continue
+        candidates.append({'tabla': table, 'columnas': key, 'tipo': 'clave'})
+
+        covering = _dedupe(key + cols['other'])
+        if covering != key:
+            candidates.append({'tabla': table, 'columnas': covering, 'tipo': 'cubriente'})
+
+    return candidates
+
+
+def _match_column(columns: List[str], name: str) -> Optional[str]:
+    for column in columns:
+        if column.lower() == name.lower():
+            return column
+    return None
+
+
+def _dedupe(values: List[str]) -> List[str]:
+    return list(dict.fromkeys(values))
+
+
+# ============================================================================
+# HARNESS DE BENCHMARK Y ASESOR DE ÍNDICES
+# ============================================================================
+
+class QueryBenchmark:
+    """
+    Ejecuta el workload SQL del proyecto sobre una copia de la base de datos,
+    mide cada consulta (con calentamiento y repeticiones), captura
+    EXPLAIN QUERY PLAN y evalúa índices candidatos midiendo la mejora y el
+    espacio que ocupa cada uno.
+
+    Reemplaza el proceso manual del Avance 2 (.timer on + índices elegidos a mano).
+    """
+
+    def __init__(self, db_path: str, warmup: int = 1, repetitions: int = 5,
+                 work_dir: Optional[str] = None, drop_existing_indexes: bool = True):
+        """
+        Inicializa el harness.
+
+        Args:
+            db_path: Ruta a la base de datos SQLite original (no se modifica)
+            warmup: Ejecuciones descartadas antes de medir
+            repetitions: Ejecuciones medidas por consulta
+            work_dir: Directorio para la copia de trabajo (por defecto, el temporal del sistema)
+            drop_existing_indexes: Si es True, la línea base se mide sin los índices
+                                   creados a mano en la copia
+        """
+        self.db_path = db_path
+        self.warmup = warmup
+        self.repetitions = repetitions
+        self.work_dir = work_dir
+        self.drop_existing_indexes = drop_existing_indexes
+
+        self._tmp_dir: Optional[str] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # ------------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------------
+
+    def __enter__(self) -> 'QueryBenchmark':
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """Copia la base de datos a un directorio temporal y abre la conexión."""
+        self._tmp_dir = tempfile.mkdtemp(dir=self.work_dir)
+        db_copy = os.path.join(self._tmp_dir, os.path.basename(self.db_path))
+        shutil.copyfile(self.db_path, db_copy)
+        self._conn = sqlite3.connect(db_copy)
+
+        if self.drop_existing_indexes:
+            for name in self.existing_indexes():
+                self._conn.execute(f'DROP INDEX "{name}"')
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Cierra la conexión y elimina la copia de trabajo."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._tmp_dir is not None:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+            self._tmp_dir = None
+
+    # ------------------------------------------------------------------------
+    # Inspección
+    # ------------------------------------------------------------------------
+
+    def schema(self) -> Dict[str, List[str]]:
+        """Tablas reales de la base de datos y sus columnas."""
+        tables = [row[0] for row in self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )]
+        return {
+            table: [row[1] for row in self._conn.execute(f'PRAGMA table_info("{table}")')]
+            for table in tables
+        }
+
+    def existing_indexes(self) -> List[str]:
+        """Índices creados explícitamente (excluye los automáticos de SQLite)."""
+        return [row[0] for row in self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+        )]
+
+    def explain(self, sql: str) -> List[str]:
+        """
+        Captura el plan de ejecución de una consulta.
+
+        Returns:
+            Lista de líneas del plan, indentadas según su nivel
+        """
+        rows = self._conn.execute('EXPLAIN QUERY PLAN ' + sql).fetchall()
+        depth = {0: -1}
+        lines = []
+        for node_id, parent, _, detail in rows:
+            depth[node_id] = depth.get(parent, -1) + 1
+            lines.append('  ' * depth[node_id] + detail)
+        return lines
+
+    def time_query(self, sql: str) -> Dict[str, float]:
+        """
+        Mide una consulta con calentamiento y repeticiones.
+
+        Returns:
+            Dict con promedio, mediana, mínimo, máximo y desviación estándar en ms
+        """
+        for _ in range(self.warmup):
+            self._conn.execute(sql).fetchall()
+
+        times = []
+        for _ in range(self.repetitions):
+            start = time.perf_counter()
+            self._conn.execute(sql).fetchall()
+            times.append(time.perf_counter() - start)
+
+        return {
+            'promedio_ms': statistics.mean(times) * 1000,
+            'mediana_ms': statistics.median(times) * 1000,
+            'minimo_ms': min(times) * 1000,
+            'maximo_ms': max(times) * 1000,
+            'stdev_ms': (statistics.stdev(times) if len(times) > 1 else 0.0) * 1000,
+        }
+
+    # ------------------------------------------------------------------------
+    # Workload
+    # ------------------------------------------------------------------------
+
+    def run_workload(self, statements: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Mide todas las consultas del workload sin índices adicionales.
+
+        En las tablas temporales (CREATE TEMP TABLE ... AS SELECT) se mide el
+        SELECT que las llena, que es donde está el trabajo real; después se
+        crean una vez, en orden, para las consultas que dependen de ellas, y
+        se eliminan al terminar para poder repetir el workload. Las sentencias
+        que modifican la base (triggers, INSERT, CREATE INDEX, DROP) no se ejecutan.
+
+        Returns:
+            Lista de dicts con la consulta, sus tiempos y su plan de ejecución
+        """
+        results = []
+        temp_tables = []
+        try:
+            for number, statement in enumerate(statements, 1):
+                if statement['tipo'] not in ('query', 'setup'):
+                    continue
+
+                sql = statement['sql']
+                match = _SETUP_PATTERN.match(sql) if statement['tipo'] == 'setup' else None
+                if match:
+                    sql = sql[match.end():]
+
+                results.append({
+                    'id': number,
+                    'descripcion': statement['descripcion'],
+                    'origen': statement['origen'],
+                    'sql': sql,
+                    'tabla_temporal': match.group(1) if match else None,
+                    'tiempos': self.time_query(sql),
+                    'plan': self.explain(sql),
+                })
+
+                if statement['tipo'] == 'setup':
+                    temp_tables.append(self._create_temp_table(statement['sql']))
+        finally:
+            self._drop_temp_tables(temp_tables)
+        return results
+
+    def advise_indexes(self, statements: List[Dict[str, str]],
+                       baseline: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        Evalúa los índices candidatos de cada consulta y los índices de los scripts.
+
+        Cada índice se crea, se miden las consultas que podrían usarlo, se
+        registra el espacio ocupado (diferencia de páginas) y se elimina antes
+        de probar el siguiente.
+
+        Args:
+            statements: Workload cargado con load_workload
+            baseline: Resultados de run_workload (se calculan si no se pasan)
+
+        Returns:
+            Lista de dicts por (índice, consulta) con mejora, espacio y plan
+        """
+        if baseline is None:
+            baseline = self.run_workload(statements)
+
+        schema = self.schema()
+        candidates: Dict[tuple, Dict[str, Any]] = {}
+
+        for query in baseline:
+            for candidate in derive_candidate_indexes(query['sql'], schema):
+                key = (candidate['tabla'], tuple(candidate['columnas']))
+                entry = candidates.setdefault(key, dict(candidate, consultas=[]))
+                entry['consultas'].append(query)
+
+        # Índices creados a mano en los scripts (p. ej. idx_sales_product_salesperson)
+        for statement in statements:
+            match = _INDEX_PATTERN.search(statement['sql']) if statement['tipo'] == 'index' else None
+            if not match:
+                continue
+            table = _match_column(list(schema), match.group(2))
+            if table is None:
+                continue
+            columns = [c.strip() for c in match.group(3).split(',')]
+            key = (table, tuple(columns))
+            entry = candidates.setdefault(key, {'tabla': table, 'columnas': columns, 'consultas': []})
+            entry['tipo'] = 'script: ' + match.group(1)
+            for query in baseline:
+                if table in _tables_in(query['sql'], schema) and query not in entry['consultas']:
+                    entry['consultas'].append(query)
+
+        # Las consultas que leen tablas temporales las necesitan durante la evaluación
+        temp_tables = [self._create_temp_table(statement['sql'])
+                       for statement in statements if statement['tipo'] == 'setup']
+
+        report = []
+        try:
+            for number, ((table, columns), candidate) in enumerate(candidates.items(), 1):
+                name = f"idx_auto_{number}_{table}_{'_'.join(columns)}".lower()
+                storage, build_ms = self._create_index(name, table, columns)
+                try:
+                    for query in candidate['consultas']:
+                        timings = self.time_query(query['sql'])
+                        plan = self.explain(query['sql'])
+                        before = query['tiempos']['mediana_ms']
+                        after = timings['mediana_ms']
+                        report.append({
+                            'indice': f"{table}({', '.join(columns)})",
+                            'tipo': candidate['tipo'],
+                            'consulta_id': query['id'],
+                            'descripcion': query['descripcion'],
+                            'base_ms': before,
+                            'con_indice_ms': after,
+                            'mejora_percent': (before - after) / before * 100 if before else 0.0,
+                            'factor': before / after if after else float('inf'),
+                            'espacio_bytes': storage,
+                            'creacion_ms': build_ms,
+                            'usado_en_plan': any(name in line for line in plan),
+                            'plan': plan,
+                        })
+                finally:
+                    self._conn.execute(f'DROP INDEX "{name}"')
+                    self._conn.commit()
+        finally:
+            self._drop_temp_tables(temp_tables)
+
+        report.sort(key=lambda row: row['mejora_percent'], reverse=True)
+        return report
+
+    def _create_temp_table(self, sql: str) -> Optional[str]:
+        # Se elimina primero para que el workload pueda repetirse en la misma conexión
+        match = _SETUP_PATTERN.match(sql)
+        if match:
+            self._conn.execute(f'DROP TABLE IF EXISTS temp."{match.group(1)}"')
+        self._conn.execute(sql)
+        return match.group(1) if match else None
+
+    def _drop_temp_tables(self, tables: List[Optional[str]]) -> None:
+        for table in tables:
+            if table is not None:
+                self._conn.execute(f'DROP TABLE IF EXISTS temp."{table}"')
+
+    def _used_pages(self) -> int:
+        # Las páginas liberadas por DROP INDEX quedan en la freelist y se reutilizan
+        total = self._conn.execute('PRAGMA page_count').fetchone()[0]
+        free = self._conn.execute('PRAGMA freelist_count').fetchone()[0]
+        return total - free
+
+    def _create_index(self, name: str, table: str, columns: List[str]):
+        page_size = self._conn.execute('PRAGMA page_size').fetchone()[0]
+        pages_before = self._used_pages()
+
+        start = time.perf_counter()
+        cols = ', '.join(f'"{c}"' for c in columns)
+        self._conn.execute(f'CREATE INDEX "{name}" ON "{table}" ({cols})')
+        self._conn.commit()
+        build_ms = (time.perf_counter() - start) * 1000
+
+        pages_after = self._used_pages()
+        return (pages_after - pages_before) * page_size, build_ms
+
+    # ------------------------------------------------------------------------
+    # Reporte
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def print_baseline(baseline: List[Dict[str, Any]], show_plan: bool = True) -> None:
+        """Imprime los tiempos y planes de la línea base."""
+        print("\n" + "=" * 80)
+        print("⏱️  LÍNEA BASE DEL WORKLOAD SQL")
+        print("=" * 80)
+
+        for query in baseline:
+            t = query['tiempos']
+            temp = f" → TEMP {query['tabla_temporal']}" if query.get('tabla_temporal') else ''
+            print(f"\n#{query['id']} [{query['origen']}] {query['descripcion']}{temp}")
+            print(f"   Mediana: {t['mediana_ms']:.3f} ms | Mín: {t['minimo_ms']:.3f} ms | Máx: {t['maximo_ms']:.3f} ms")
+            if show_plan:
+                for line in query['plan']:
+                    print(f"   │ {line}")
+
+        print("=" * 80)
+
+    @staticmethod
+    def print_advice(report: List[Dict[str, Any]]) -> None:
+        """Imprime la tabla de índices candidatos ordenada por mejora."""
+        print("\n" + "=" * 80)
+        print("💡 ASESOR DE ÍNDICES")
+        print("=" * 80)
+        print(f"\n{'Índice':<45} {'Consulta':<9} {'Base (ms)':>10} {'Con índice':>11} {'Mejora':>8} {'Espacio':>10}")
+        print("-" * 98)
+
+        for row in report:
+            used = '' if row['usado_en_plan'] else ' (no usado)'
+            print(f"{row['indice'][:44]:<45} #{row['consulta_id']:<8} {row['base_ms']:>10.3f} "
+                  f"{row['con_indice_ms']:>11.3f} {row['mejora_percent']:>7.1f}% "
+                  f"{row['espacio_bytes'] / 1024 ** 2:>7.2f} MB{used}")
+
+        useful = [row for row in report if row['usado_en_plan'] and row['mejora_percent'] > 0]
+        if useful:
+            best = useful[0]
+            print(f"\n✅ Mejor índice: {best['indice']} → {best['mejora_percent']:.1f}% en la consulta "
+                  f"#{best['consulta_id']} ({best['espacio_bytes'] / 1024 ** 2:.2f} MB)")
+        print("=" * 80)
+
+
+def _tables_in(sql: str, schema: Dict[str, List[str]]) -> List[str]:
+    lower_schema = {table.lower(): table for table in schema}
+    return [lower_schema[t.lower()] for t, _ in _TABLE_PATTERN.findall(sql) if t.lower() in lower_schema]
+
+
+# ============================================================================
+# FUNCIÓN PRINCIPAL
+# ============================================================================
+
+def main():
+    """Ejecuta el benchmark del workload y el asesor de índices desde la línea de comandos."""
+    default_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+    parser = argparse.ArgumentParser(description='Benchmark del workload SQL y asesor de índices')
+    parser.add_argument('--db', default=os.path.join(default_root, 'data', 'proyecto_integrador.db'))
+    parser.add_argument('--root', default=default_root, help='Raíz del proyecto (contiene Avance 1 y Avance 2)')
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repetitions', type=int, default=5)
+    parser.add_argument('--keep-indexes', action='store_true',
+                        help='Medir la línea base con los índices que ya tiene la base de datos')
+    args = parser.parse_args()
+
+    statements = load_workload(args.root)
+
+    with QueryBenchmark(args.db, warmup=args.warmup, repetitions=args.repetitions,
+                        drop_existing_indexes=not args.keep_indexes) as bench:
+        baseline = bench.run_workload(statements)
+        bench.print_baseline(baseline)
+        bench.print_advice(bench.advise_indexes(statements, baseline))
+
+
+if __name__ == "__main__":
+    main()